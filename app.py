@@ -5,19 +5,24 @@ Main application orchestrating:
 - Cluster document management
 - Project matching
 """
+import hashlib
+import io
 import streamlit as st
 import pandas as pd
+from collections import Counter
 from pathlib import Path
+from typing import Dict, List, Tuple
 
 from core.analyzer import ProjectAnalyzer
 from core.document_processor import ClusterDocumentManager
 from core.matcher import ClusterMatcher
+from core.models import ProjectMatch
 # REMOVED: from core.llm_integration import LLMAnalyzer, LLMConfig
 
 from ui.statistics import display_statistics
 from ui.project_card import display_match_card
 from ui.pagination import display_pagination, get_paginated_items
-from ui.filters import display_filters, apply_filters
+from ui.filters import display_filters, apply_filters, build_match_frame
 from ui.cluster_view import (
     display_cluster_statistics,
     display_cluster_search,
@@ -25,7 +30,14 @@ from ui.cluster_view import (
     display_cluster_browser
 )
 
-from utils.export import export_to_csv, export_to_json
+from utils.export import cached_export_to_csv, cached_export_to_json
+
+from config.keywords import (
+    CATEGORIES,
+    HIGH_PRIORITY_THRESHOLD,
+    MEDIUM_PRIORITY_THRESHOLD,
+    MIN_SCORE_THRESHOLD
+)
 
 
 def init_session_state():
@@ -35,6 +47,9 @@ def init_session_state():
         'analyzer': None,
         'matches': [],
         'analyzed': False,
+        'match_aggregates': None,
+        'match_frame': None,
+        'analysis_key': None,
         
         # Pagination
         'current_page': 1,
@@ -53,23 +68,57 @@ def init_session_state():
             st.session_state[key] = value
 
 
-def load_cluster_documents() -> bool:
+@st.cache_resource(show_spinner=False)
+def _get_cluster_manager(clusters_path: str) -> ClusterDocumentManager:
+    """Cluster documents, parsed once and shared by all sessions"""
+    return ClusterDocumentManager(clusters_path)
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _get_cluster_matcher(clusters_path: str, cluster_fingerprint: Tuple,
+                         _cluster_manager: ClusterDocumentManager) -> ClusterMatcher:
+    """Matcher over the shared cluster documents
+    
+    Bound to the manager object it was built from: clear it whenever _get_cluster_manager is
+    cleared (see _clear_cluster_caches). Only the current matcher is kept.
+    """
+    return ClusterMatcher(_cluster_manager)
+
+
+def _clear_cluster_caches():
+    """Drop the shared cluster documents and the matcher built over them"""
+    _get_cluster_manager.clear()
+    _get_cluster_matcher.clear()
+
+
+def load_cluster_documents(reload: bool = False) -> bool:
     """Load cluster documents from clusters/ folder
     
+    Args:
+        reload: Re-read the folder instead of reusing the shared documents
+    
     Returns:
         True if documents were loaded successfully
     """
-    clusters_path = Path(__file__).parent / "clusters"
+    clusters_path = str(Path(__file__).parent / "clusters")
     
     try:
-        cluster_manager = ClusterDocumentManager(str(clusters_path))
+        if reload:
+            _clear_cluster_caches()
+        cluster_manager = _get_cluster_manager(clusters_path)
         st.session_state.cluster_manager = cluster_manager
         
         if cluster_manager.documents:
-            st.session_state.cluster_matcher = ClusterMatcher(cluster_manager)
+            st.session_state.cluster_matcher = _get_cluster_matcher(
+                clusters_path,
+                cluster_manager.fingerprint,
+                cluster_manager
+            )
             st.session_state.clusters_loaded = True
             return True
         else:
+            # Don't share an empty result: documents may be added later
+            _clear_cluster_caches()
             st.warning("Clusters folder found but no valid documents loaded")
             return False
     except Exception as e:
@@ -77,6 +126,14 @@ def load_cluster_documents() -> bool:
         return False
 
 
+def compute_match_aggregates(matches) -> Dict:
+    """Per-sheet match counts and distinct technologies, computed once per analysis"""
+    return {
+        'sheet_counts': Counter(m.sheet_name for m in matches),
+        'technologies': set().union(*(m.technologies for m in matches))
+    }
+
+
 def display_sidebar():
     """Display sidebar with configuration and statistics"""
     with st.sidebar:
@@ -88,7 +145,7 @@ def display_sidebar():
         
         if st.button("Load/Reload Clusters", use_container_width=True):
             with st.spinner("Loading cluster documents..."):
-                if load_cluster_documents():
+                if load_cluster_documents(reload=True):
                     stats = st.session_state.cluster_manager.get_statistics()
                     st.success(f"Loaded {stats['total_documents']} documents "
                              f"with {stats['total_projects']} projects")
@@ -103,37 +160,12 @@ def display_sidebar():
         
         # Keywords section
         with st.expander("View Keywords"):
-            from config.keywords import (
-                BLOCKCHAIN_KEYWORDS,
-                PRIVACY_KEYWORDS,
-                DATA_GOVERNANCE_KEYWORDS,
-                AI_KEYWORDS,
-                IOT_KEYWORDS
-            )
-            
-            st.subheader("Blockchain/DLT")
-            st.caption(", ".join(BLOCKCHAIN_KEYWORDS))
-            
-            st.subheader("Privacy-Preserving")
-            st.caption(", ".join(PRIVACY_KEYWORDS))
-            
-            st.subheader("Data Governance")
-            st.caption(", ".join(DATA_GOVERNANCE_KEYWORDS))
-            
-            st.subheader("AI/ML")
-            st.caption(", ".join(AI_KEYWORDS))
-            
-            st.subheader("IoT")
-            st.caption(", ".join(IOT_KEYWORDS))
+            for _, keywords, _, technology in CATEGORIES:
+                st.subheader(technology)
+                st.caption(", ".join(keywords))
         
         # Scoring thresholds
         with st.expander("Scoring Thresholds"):
-            from config.keywords import (
-                HIGH_PRIORITY_THRESHOLD,
-                MEDIUM_PRIORITY_THRESHOLD,
-                MIN_SCORE_THRESHOLD
-            )
-            
             st.write(f"**High Priority:** >= {HIGH_PRIORITY_THRESHOLD}")
             st.write(f"**Medium Priority:** >= {MEDIUM_PRIORITY_THRESHOLD}")
             st.write(f"**Minimum Score:** >= {MIN_SCORE_THRESHOLD}")
@@ -144,16 +176,37 @@ def display_sidebar():
             st.subheader("Quick Stats")
             st.metric("Total Matches", len(st.session_state.matches))
             
-            sheets = set(m.sheet_name for m in st.session_state.matches)
-            with st.expander(f" Sheets ({len(sheets)})"):
-                for sheet in sorted(sheets):
-                    count = sum(1 for m in st.session_state.matches if m.sheet_name == sheet)
-                    st.write(f"{sheet}: {count}")
+            if st.session_state.match_aggregates is None:
+                st.session_state.match_aggregates = compute_match_aggregates(st.session_state.matches)
+            aggregates = st.session_state.match_aggregates
             
-            all_techs = set()
-            for m in st.session_state.matches:
-                all_techs.update(m.technologies)
-            st.metric("Technologies", len(all_techs))
+            sheet_counts = aggregates['sheet_counts']
+            with st.expander(f" Sheets ({len(sheet_counts)})"):
+                for sheet in sorted(sheet_counts):
+                    st.write(f"{sheet}: {sheet_counts[sheet]}")
+            
+            st.metric("Technologies", len(aggregates['technologies']))
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _run_analysis(file_bytes: bytes, filename: str) -> ProjectAnalyzer:
+    """Analyze an uploaded workbook
+    
+    Cached on the file contents, so analyzing the same upload again is a cache hit.
+    """
+    temp_path = Path("/tmp") / filename
+    with open(temp_path, "wb") as f:
+        f.write(file_bytes)
+    
+    analyzer = ProjectAnalyzer(str(temp_path))
+    analyzer.analyze_all()
+    return analyzer
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _sheet_names(file_bytes: bytes) -> List[str]:
+    """List the sheets of an uploaded workbook (cached on the file contents)"""
+    return pd.ExcelFile(io.BytesIO(file_bytes)).sheet_names
 
 
 def display_file_upload():
@@ -167,16 +220,14 @@ def display_file_upload():
     )
     
     if uploaded_file is not None:
-        temp_path = Path("/tmp") / uploaded_file.name
-        with open(temp_path, "wb") as f:
-            f.write(uploaded_file.getbuffer())
+        file_bytes = uploaded_file.getvalue()
         
         st.success(f"File uploaded: {uploaded_file.name}")
         
         # Show available sheets
         try:
-            xls = pd.ExcelFile(temp_path)
-            st.info(f" Found {len(xls.sheet_names)} sheet(s): {', '.join(xls.sheet_names)}")
+            sheet_names = _sheet_names(file_bytes)
+            st.info(f" Found {len(sheet_names)} sheet(s): {', '.join(sheet_names)}")
         except Exception as e:
             st.error(f"Error reading file: {e}")
         
@@ -184,11 +235,14 @@ def display_file_upload():
         if st.button("Analyze Projects", type="primary", use_container_width=True):
             with st.spinner("Analyzing all sheets..."):
                 try:
-                    analyzer = ProjectAnalyzer(str(temp_path))
-                    matches = analyzer.analyze_all()
+                    analyzer = _run_analysis(file_bytes, uploaded_file.name)
+                    matches = analyzer.matches
                     
                     st.session_state.analyzer = analyzer
+                    st.session_state.analysis_key = hashlib.sha1(file_bytes).hexdigest()
                     st.session_state.matches = matches
+                    st.session_state.match_aggregates = compute_match_aggregates(matches)
+                    st.session_state.match_frame = build_match_frame(matches)
                     st.session_state.analyzed = True
                     st.session_state.current_page = 1
                     
@@ -207,6 +261,17 @@ def display_file_upload():
                     st.code(traceback.format_exc())
 
 
+@st.cache_data(show_spinner=False, max_entries=2048)
+def _cached_cluster_match(match_key: Tuple, cluster_fingerprint: Tuple,
+                          _matcher: ClusterMatcher, _match: ProjectMatch) -> Dict:
+    """Cluster matches for one Excel project
+    
+    Keyed on the project and the loaded cluster documents, so reruns (filters,
+    paging) reuse earlier results instead of re-scoring every cluster project.
+    """
+    return _matcher.match_excel_with_clusters(_match)
+
+
 def display_excel_results():
     """Display Excel analysis results"""
     st.divider()
@@ -217,22 +282,25 @@ def display_excel_results():
     st.divider()
     
     # Filters
-    priority_filter, tech_filter, sheet_filter = display_filters(st.session_state.matches)
+    if st.session_state.match_frame is None:
+        st.session_state.match_frame = build_match_frame(st.session_state.matches)
+    
+    priority_filter, tech_filter, sheet_filter = display_filters(st.session_state.match_frame)
     
     # Apply filters
-    filtered_matches = apply_filters(
-        st.session_state.matches,
+    filtered_positions = apply_filters(
+        st.session_state.match_frame,
         priority_filter,
         tech_filter,
         sheet_filter
     )
     
     # Reset page if filter changes
-    if st.session_state.last_filter_count != len(filtered_matches):
+    if st.session_state.last_filter_count != len(filtered_positions):
         st.session_state.current_page = 1
-        st.session_state.last_filter_count = len(filtered_matches)
+        st.session_state.last_filter_count = len(filtered_positions)
     
-    st.write(f"**Showing {len(filtered_matches)} of {len(st.session_state.matches)} projects**")
+    st.write(f"**Showing {len(filtered_positions)} of {len(st.session_state.matches)} projects**")
     
     # Pagination settings
     st.divider()
@@ -254,13 +322,14 @@ def display_excel_results():
     st.divider()
     st.header("Matched Projects")
     
-    if filtered_matches:
-        current_page = display_pagination(len(filtered_matches), st.session_state.items_per_page)
-        page_items, start_idx = get_paginated_items(
-            filtered_matches, 
+    if len(filtered_positions):
+        current_page = display_pagination(len(filtered_positions), st.session_state.items_per_page)
+        page_positions, start_idx = get_paginated_items(
+            filtered_positions, 
             current_page, 
             st.session_state.items_per_page
         )
+        page_items = [st.session_state.matches[pos] for pos in page_positions]
         
         for idx, match in enumerate(page_items, start=start_idx + 1):
             display_match_card(match, idx, show_cluster_matches=False)
@@ -268,16 +337,21 @@ def display_excel_results():
             # Show cluster matches if enabled
             if show_clusters and st.session_state.cluster_matcher:
                 with st.expander("Cluster Matches", expanded=False):
-                    cluster_result = st.session_state.cluster_matcher.match_excel_with_clusters(match)
+                    cluster_result = _cached_cluster_match(
+                        (st.session_state.analysis_key, match.sheet_name, match.row_index),
+                        st.session_state.cluster_manager.fingerprint,
+                        st.session_state.cluster_matcher,
+                        match
+                    )
                     display_cluster_matches_for_excel(cluster_result)
         
         st.divider()
-        display_pagination(len(filtered_matches), st.session_state.items_per_page)
+        display_pagination(len(filtered_positions), st.session_state.items_per_page)
     else:
         st.warning("No projects match the current filters.")
     
     # Export section
-    display_export_section(filtered_matches)
+    display_export_section([st.session_state.matches[pos] for pos in filtered_positions])
 
 
 def display_cluster_tab():
@@ -309,16 +383,27 @@ def display_cluster_tab():
         display_cluster_browser(st.session_state.cluster_manager)
 
 
+def _matches_signature(matches) -> Tuple:
+    """Cache key identifying the analyzed file and a selection of its matches"""
+    return (
+        st.session_state.analysis_key,
+        tuple((m.sheet_name, m.row_index) for m in matches)
+    )
+
+
 def display_export_section(filtered_matches):
     """Display export buttons"""
     st.divider()
     st.header("Export Results")
     
+    filtered_signature = _matches_signature(filtered_matches)
+    all_signature = _matches_signature(st.session_state.matches)
+    
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("Filtered Results")
-        csv_data = export_to_csv(filtered_matches)
+        csv_data = cached_export_to_csv(filtered_signature, filtered_matches)
         st.download_button(
             label="Download CSV",
             data=csv_data,
@@ -327,7 +412,7 @@ def display_export_section(filtered_matches):
             use_container_width=True
         )
         
-        json_data = export_to_json(filtered_matches)
+        json_data = cached_export_to_json(filtered_signature, filtered_matches)
         st.download_button(
             label="Download JSON",
             data=json_data,
@@ -338,7 +423,7 @@ def display_export_section(filtered_matches):
     
     with col2:
         st.subheader("All Results")
-        csv_all = export_to_csv(st.session_state.matches)
+        csv_all = cached_export_to_csv(all_signature, st.session_state.matches)
         st.download_button(
             label="Download CSV",
             data=csv_all,
@@ -347,7 +432,7 @@ def display_export_section(filtered_matches):
             use_container_width=True
         )
         
-        json_all = export_to_json(st.session_state.matches)
+        json_all = cached_export_to_json(all_signature, st.session_state.matches)
         st.download_button(
             label="Download JSON",
             data=json_all,
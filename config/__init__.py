@@ -9,7 +9,14 @@ from .keywords import (
     WEIGHTS,
     MIN_SCORE_THRESHOLD,
     HIGH_PRIORITY_THRESHOLD,
-    MEDIUM_PRIORITY_THRESHOLD
+    MEDIUM_PRIORITY_THRESHOLD,
+    BLOCKCHAIN_KEYWORDS_LC,
+    PRIVACY_KEYWORDS_LC,
+    DATA_GOVERNANCE_KEYWORDS_LC,
+    AI_KEYWORDS_LC,
+    IOT_KEYWORDS_LC,
+    CATEGORIES,
+    ALL_KEYWORDS
 )
 
 __all__ = [
@@ -21,5 +28,12 @@ __all__ = [
     'WEIGHTS',
     'MIN_SCORE_THRESHOLD',
     'HIGH_PRIORITY_THRESHOLD',
-    'MEDIUM_PRIORITY_THRESHOLD'
+    'MEDIUM_PRIORITY_THRESHOLD',
+    'BLOCKCHAIN_KEYWORDS_LC',
+    'PRIVACY_KEYWORDS_LC',
+    'DATA_GOVERNANCE_KEYWORDS_LC',
+    'AI_KEYWORDS_LC',
+    'IOT_KEYWORDS_LC',
+    'CATEGORIES',
+    'ALL_KEYWORDS'
 ]
\ No newline at end of file
@@ -82,4 +82,23 @@ WEIGHTS = {
 
 MIN_SCORE_THRESHOLD = 3
 HIGH_PRIORITY_THRESHOLD = 9
-MEDIUM_PRIORITY_THRESHOLD = 6
\ No newline at end of file
+MEDIUM_PRIORITY_THRESHOLD = 6
+
+# Lowercased keyword tuples, ready for matching against lowercased text
+BLOCKCHAIN_KEYWORDS_LC = tuple(kw.lower() for kw in BLOCKCHAIN_KEYWORDS)
+PRIVACY_KEYWORDS_LC = tuple(kw.lower() for kw in PRIVACY_KEYWORDS)
+DATA_GOVERNANCE_KEYWORDS_LC = tuple(kw.lower() for kw in DATA_GOVERNANCE_KEYWORDS)
+AI_KEYWORDS_LC = tuple(kw.lower() for kw in AI_KEYWORDS)
+IOT_KEYWORDS_LC = tuple(kw.lower() for kw in IOT_KEYWORDS)
+
+# (category, keywords, weight, technology), in the order technologies are reported
+CATEGORIES = (
+    ('blockchain', BLOCKCHAIN_KEYWORDS_LC, WEIGHTS['blockchain'], 'Blockchain/DLT'),
+    ('privacy', PRIVACY_KEYWORDS_LC, WEIGHTS['privacy'], 'Privacy-Preserving'),
+    ('data_governance', DATA_GOVERNANCE_KEYWORDS_LC, WEIGHTS['data_governance'], 'Data Governance'),
+    ('ai', AI_KEYWORDS_LC, WEIGHTS['ai'], 'AI/ML'),
+    ('iot', IOT_KEYWORDS_LC, WEIGHTS['iot'], 'IoT')
+)
+
+# Every keyword in category order
+ALL_KEYWORDS = tuple(kw for _, keywords, _, _ in CATEGORIES for kw in keywords)
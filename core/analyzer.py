@@ -1,20 +1,143 @@
 """Core analysis logic"""
 
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Tuple
+from pandas.io.parsers import TextParser
+from typing import List, Dict, Tuple, Iterator, Optional
 from pathlib import Path
 
 from .models import ProjectMatch
+from .keyword_automaton import build_keyword_automaton, find_keywords
+from .keyword_kernel import build_keyword_table, keyword_hits_compiled
 from config.keywords import (
-    BLOCKCHAIN_KEYWORDS,
-    PRIVACY_KEYWORDS,
-    DATA_GOVERNANCE_KEYWORDS,
-    AI_KEYWORDS,
-    IOT_KEYWORDS,
-    WEIGHTS,
-    MIN_SCORE_THRESHOLD
+    CATEGORIES,
+    ALL_KEYWORDS,
+    MIN_SCORE_THRESHOLD,
+    HIGH_PRIORITY_THRESHOLD,
+    MEDIUM_PRIORITY_THRESHOLD
 )
 
+# Rust-based Excel parser, much faster than openpyxl (pandas >= 2.2)
+try:
+    import python_calamine  # noqa: F401
+    CALAMINE_SUPPORT = True
+except ImportError:
+    CALAMINE_SUPPORT = False
+
+
+# Below this many rows in total, starting worker processes costs more than it saves
+PARALLEL_MIN_ROWS = 5000
+
+# .xlsx files at least this large are streamed row by row instead of loaded whole
+STREAM_MIN_BYTES = 50 * 1024 * 1024
+
+# Rows scored at a time when streaming
+STREAM_CHUNK_ROWS = 5000
+
+# From this many rows on, the compiled keyword scan (numba) is used when available
+COMPILED_MIN_ROWS = 5000
+
+
+# One alternation per category, used to find the rows worth checking keyword by keyword.
+# No word boundaries: keywords are matched as plain substrings, like calculate_score does.
+_CATEGORY_PATTERNS = {
+    category: re.compile('|'.join(re.escape(kw) for kw in keywords))
+    for category, keywords, _, _ in CATEGORIES
+}
+
+# Weight of each column of the hit matrix (one column per keyword in ALL_KEYWORDS)
+_KEYWORD_WEIGHTS = np.array([
+    weight
+    for _, keywords, weight, _ in CATEGORIES
+    for _ in keywords
+])
+
+# Single-pass matcher over all keywords (None without pyahocorasick)
+_KEYWORD_AUTOMATON = build_keyword_automaton(ALL_KEYWORDS)
+
+# Packed keywords for the compiled scan (None without numba)
+_KEYWORD_TABLE = build_keyword_table(ALL_KEYWORDS)
+
+
+def _keyword_hits(text_series: pd.Series,
+                  memo: Optional[Dict[str, Tuple[int, ...]]] = None) -> np.ndarray:
+    """Boolean matrix (rows x keywords) of keyword hits in lowercased text
+    
+    Large inputs go through the compiled scan when numba is available. Otherwise uses the
+    Aho-Corasick automaton when available, vectorized pandas string matching as a last resort.
+    The automaton results are kept in `memo` (text -> keyword positions) when given, so texts
+    repeated across rows and sheets are scanned once.
+    """
+    if _KEYWORD_TABLE is not None and len(text_series) >= COMPILED_MIN_ROWS:
+        return keyword_hits_compiled(_KEYWORD_TABLE, text_series.tolist())
+    
+    hits = np.zeros((len(text_series), len(ALL_KEYWORDS)), dtype=bool)
+    
+    if _KEYWORD_AUTOMATON is not None:
+        if memo is None:
+            memo = {}
+        for row, text in enumerate(text_series):
+            found = memo.get(text)
+            if found is None:
+                found = memo[text] = tuple(find_keywords(_KEYWORD_AUTOMATON, text))
+            if found:
+                hits[row, list(found)] = True
+        return hits
+    
+    col = 0
+    for category, keywords, _, _ in CATEGORIES:
+        in_category = text_series.str.contains(_CATEGORY_PATTERNS[category]).to_numpy(dtype=bool)
+        candidates = text_series[in_category]
+        
+        for kw in keywords:
+            hits[in_category, col] = candidates.str.contains(kw, regex=False).to_numpy(dtype=bool)
+            col += 1
+    
+    return hits
+
+
+def _row_texts(df: pd.DataFrame) -> pd.Series:
+    """Join the non-null cells of every row into one lowercased text, column by column
+    
+    Cells are read from df.values, as df.iterrows() reads them, so numbers and dates are
+    written out exactly like a per-row ' '.join() writes them.
+    """
+    if df.shape[1] == 0:
+        return pd.Series('', index=df.index)
+    
+    values = df.values
+    
+    # Each non-null cell contributes ' ' + its text, missing cells nothing, so dropping the
+    # leading space gives the same text as ' '.join() over the row's non-null cells
+    pieces = []
+    for i in range(values.shape[1]):
+        column = pd.Series(values[:, i], index=df.index)
+        pieces.append((' ' + column.astype(object).astype(str)).where(column.notna(), ''))
+    
+    texts = pieces[0].str.cat(pieces[1:], sep='') if len(pieces) > 1 else pieces[0]
+    return texts.str.slice(1).str.lower()
+
+
+def _summarize_hits(row_hits: np.ndarray) -> Tuple[Dict[str, List[str]], List[str]]:
+    """Turn one row of the hit matrix into matched keywords and technologies"""
+    matched_keywords = {}
+    technologies = []
+    col = 0
+    
+    for category, keywords, _, technology in CATEGORIES:
+        category_matches = [kw for kw, hit in zip(keywords, row_hits[col:col + len(keywords)]) if hit]
+        col += len(keywords)
+        
+        if category_matches:
+            matched_keywords[category] = category_matches
+            technologies.append(technology)
+    
+    return matched_keywords, technologies
+
 
 class ProjectAnalyzer:
     """Analyzes Excel files for project matching"""
@@ -22,65 +145,93 @@ class ProjectAnalyzer:
     def __init__(self, excel_path: str):
         self.excel_path = Path(excel_path)
         self.matches: List[ProjectMatch] = []
+        # Keyword scan results by row text, only kept while analyze_all runs
+        self._keyword_memo: Dict[str, Tuple[int, ...]] = {}
     
     def load_excel(self) -> Dict[str, pd.DataFrame]:
         """Load all sheets from Excel file"""
-        excel_file = pd.ExcelFile(self.excel_path)
-        sheets = {}
+        # Open the workbook once and parse every sheet from it,
+        # instead of re-reading the file for each sheet
+        with self._open_excel() as excel_file:
+            return pd.read_excel(excel_file, sheet_name=None)
+    
+    def _open_excel(self) -> pd.ExcelFile:
+        """Open the workbook with calamine when available, pandas' default engine otherwise"""
+        if CALAMINE_SUPPORT:
+            try:
+                return pd.ExcelFile(self.excel_path, engine='calamine')
+            except ValueError:
+                # pandas < 2.2 does not know the calamine engine
+                pass
+        
+        return pd.ExcelFile(self.excel_path)
+    
+    def load_excel_stream(self, sheet_name: str) -> Iterator[Dict]:
+        """Yield the rows of one sheet as dicts without loading the whole sheet
         
-        for sheet_name in excel_file.sheet_names:
-            # Read Excel with header detection
-            df = pd.read_excel(self.excel_path, sheet_name=sheet_name)
-            sheets[sheet_name] = df
+        Cells are converted and columns named like pd.read_excel does ('Unnamed: 3', 'Title.1'),
+        and trailing empty rows are dropped; _chunk_frame applies the rest of its parsing.
+        Every row has a key for each column seen so far, blank cells included ('').
+        """
+        from openpyxl import load_workbook
+        
+        workbook = load_workbook(self.excel_path, read_only=True, data_only=True)
+        try:
+            sheet = workbook[sheet_name]
+            # The stored sheet size can be wrong; read every row that is actually there
+            sheet.reset_dimensions()
+            rows = (_trim_row([_excel_cell(cell) for cell in row]) for row in sheet.iter_rows())
+            headers = _column_names(next(rows, ()))
+            empty_rows = 0
+            
+            for row in rows:
+                if not row:
+                    # Only kept when more data follows
+                    empty_rows += 1
+                    continue
+                if len(row) > len(headers):
+                    # Data past the last header cell gets its own unnamed columns
+                    headers = _column_names(tuple(headers) + ('',) * (len(row) - len(headers)))
+                
+                for _ in range(empty_rows):
+                    yield dict.fromkeys(headers, '')
+                empty_rows = 0
+                
+                # Padded to every column, so columns blank in a whole chunk are kept too
+                yield dict(zip(headers, row + ('',) * (len(headers) - len(row))))
+        finally:
+            workbook.close()
+    
+    def _sheet_names(self) -> List[str]:
+        """Sheet names without parsing any sheet"""
+        from openpyxl import load_workbook
         
-        return sheets
+        workbook = load_workbook(self.excel_path, read_only=True)
+        try:
+            return workbook.sheetnames
+        finally:
+            workbook.close()
+    
+    def _should_stream(self) -> bool:
+        """Whether the workbook is too large to load all sheets at once"""
+        return (
+            self.excel_path.suffix.lower() == '.xlsx'
+            and self.excel_path.stat().st_size >= STREAM_MIN_BYTES
+        )
     
     def calculate_score(self, text: str) -> Tuple[int, Dict[str, List[str]], List[str]]:
         """Calculate match score and identify keywords"""
         if pd.isna(text):
             return 0, {}, []
         
-        text_lower = str(text).lower()
-        score = 0
-        matched_keywords = {}
-        technologies = []
-        
-        blockchain_matches = [kw for kw in BLOCKCHAIN_KEYWORDS if kw in text_lower]
-        if blockchain_matches:
-            score += len(blockchain_matches) * WEIGHTS['blockchain']
-            matched_keywords['blockchain'] = blockchain_matches
-            technologies.append('Blockchain/DLT')
-        
-        privacy_matches = [kw for kw in PRIVACY_KEYWORDS if kw in text_lower]
-        if privacy_matches:
-            score += len(privacy_matches) * WEIGHTS['privacy']
-            matched_keywords['privacy'] = privacy_matches
-            technologies.append('Privacy-Preserving')
-        
-        data_matches = [kw for kw in DATA_GOVERNANCE_KEYWORDS if kw in text_lower]
-        if data_matches:
-            score += len(data_matches) * WEIGHTS['data_governance']
-            matched_keywords['data_governance'] = data_matches
-            technologies.append('Data Governance')
-        
-        ai_matches = [kw for kw in AI_KEYWORDS if kw in text_lower]
-        if ai_matches:
-            score += len(ai_matches) * WEIGHTS['ai']
-            matched_keywords['ai'] = ai_matches
-            technologies.append('AI/ML')
-        
-        iot_matches = [kw for kw in IOT_KEYWORDS if kw in text_lower]
-        if iot_matches:
-            score += len(iot_matches) * WEIGHTS['iot']
-            matched_keywords['iot'] = iot_matches
-            technologies.append('IoT')
+        row_hits = _keyword_hits(pd.Series([str(text).lower()]))[0]
+        score = int(row_hits @ _KEYWORD_WEIGHTS)
+        matched_keywords, technologies = _summarize_hits(row_hits)
         
         return score, matched_keywords, technologies
     
     def determine_roles(self, score: int) -> List[str]:
         """Determine potential roles based on score"""
-        from config.keywords import HIGH_PRIORITY_THRESHOLD, MEDIUM_PRIORITY_THRESHOLD
-        
         if score >= HIGH_PRIORITY_THRESHOLD:
             return ['Technical Coordinator', 'WP Leader - Technology']
         elif score >= MEDIUM_PRIORITY_THRESHOLD:
@@ -100,9 +251,10 @@ class ProjectAnalyzer:
             ])
         
         if 'Privacy-Preserving' in technologies:
-            if 'zk' in str(matched_keywords.get('privacy', [])).lower():
+            privacy_text = ' '.join(matched_keywords.get('privacy', [])).lower()
+            if 'zk' in privacy_text:
                 contributions.append('Zero-knowledge proof implementation')
-            if 'tee' in str(matched_keywords.get('privacy', [])).lower():
+            if 'tee' in privacy_text:
                 contributions.append('Trusted Execution Environment integration')
             contributions.append('Privacy-preserving protocols')
         
@@ -130,41 +282,184 @@ class ProjectAnalyzer:
         # If there's a header row, pandas automatically uses it and starts data from index 0
         # We need to add 2 to account for: 1-based indexing + header row
         
-        for idx, row in df.iterrows():
-            combined_text = ' '.join([
-                str(row.get(col, ''))
-                for col in df.columns
-                if pd.notna(row.get(col, ''))
-            ])
+        if df.empty:
+            return matches
+        
+        # Combine all cells of a row into one lowercased text, then score every row at once
+        text_series = _row_texts(df)
+        hits = _keyword_hits(text_series, self._keyword_memo)
+        scores = hits @ _KEYWORD_WEIGHTS
+        
+        survivors = np.flatnonzero(scores >= MIN_SCORE_THRESHOLD)
+        records = df.iloc[survivors].to_dict(orient='records')
+        
+        for pos, record in zip(survivors, records):
+            score = int(scores[pos])
+            matched_keywords, technologies = _summarize_hits(hits[pos])
             
-            score, matched_keywords, technologies = self.calculate_score(combined_text)
+            # Excel row = pandas index + 2 (1 for Excel 1-based indexing, 1 for header)
+            excel_row = df.index[pos] + 2
             
-            if score >= MIN_SCORE_THRESHOLD:
-                # Excel row = pandas index + 2 (1 for Excel 1-based indexing, 1 for header)
-                excel_row = idx + 2
-                
-                match = ProjectMatch(
-                    row_index=excel_row,  # This is now the actual Excel row number
-                    sheet_name=sheet_name,
-                    score=score,
-                    matched_keywords=matched_keywords,
-                    technologies=technologies,
-                    potential_roles=self.determine_roles(score),
-                    contributions=self.suggest_contributions(technologies, matched_keywords),
-                    project_data=row.to_dict()
-                )
-                matches.append(match)
+            match = ProjectMatch(
+                row_index=excel_row,  # This is now the actual Excel row number
+                sheet_name=sheet_name,
+                score=score,
+                matched_keywords=matched_keywords,
+                technologies=technologies,
+                potential_roles=self.determine_roles(score),
+                contributions=self.suggest_contributions(technologies, matched_keywords),
+                project_data=record
+            )
+            matches.append(match)
         
         return matches
     
-    def analyze_all(self) -> List[ProjectMatch]:
-        """Analyze all sheets"""
-        sheets = self.load_excel()
-        self.matches = []
+    def analyze_sheet_stream(self, sheet_name: str, chunk_size: int = STREAM_CHUNK_ROWS) -> List[ProjectMatch]:
+        """Analyze a sheet streamed from disk, chunk_size rows at a time"""
+        chunk_results = []
+        chunk = []
+        start = 0
+        
+        for row in self.load_excel_stream(sheet_name):
+            chunk.append(row)
+            if len(chunk) == chunk_size:
+                chunk_results.append(self._analyze_chunk(sheet_name, chunk, start))
+                start += len(chunk)
+                chunk = []
+                # Keep memory bounded by one chunk
+                self._keyword_memo.clear()
         
-        for sheet_name, df in sheets.items():
-            sheet_matches = self.analyze_sheet(sheet_name, df)
-            self.matches.extend(sheet_matches)
+        if chunk:
+            chunk_results.append(self._analyze_chunk(sheet_name, chunk, start))
         
-        self.matches.sort(key=lambda x: x.score, reverse=True)
-        return self.matches
\ No newline at end of file
+        _unify_numeric_columns(chunk_results)
+        return [match for _, chunk_matches in chunk_results for match in chunk_matches]
+    
+    def _analyze_chunk(self, sheet_name: str, rows: List[Dict], start: int) -> Tuple[Dict, List[ProjectMatch]]:
+        """Analyze streamed rows; returns the dtype kind of each column along with the matches"""
+        # Rows carry every column seen so far, so the last row names them all
+        df = _chunk_frame(rows, start, list(rows[-1]))
+        column_kinds = {column: dtype.kind for column, dtype in df.dtypes.items()}
+        return column_kinds, self.analyze_sheet(sheet_name, df)
+    
+    def analyze_all(self) -> List[ProjectMatch]:
+        """Analyze all sheets"""
+        try:
+            self.matches = []
+            
+            if self._should_stream():
+                # One sheet and one chunk in memory at a time
+                for sheet_name in self._sheet_names():
+                    self.matches.extend(self.analyze_sheet_stream(sheet_name))
+            
+                self.matches.sort(key=attrgetter('score'), reverse=True)
+                return self.matches
+            
+            sheets = self.load_excel()
+            
+            workers = min(len(sheets), os.cpu_count() or 1)
+            total_rows = sum(len(df) for df in sheets.values())
+            
+            if workers > 1 and total_rows >= PARALLEL_MIN_ROWS:
+                # Sheets are independent: analyze them in separate processes
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = executor.map(
+                        _analyze_sheet_worker,
+                        [str(self.excel_path)] * len(sheets),
+                        sheets.keys(),
+                        sheets.values()
+                    )
+                    for sheet_matches in results:
+                        self.matches.extend(sheet_matches)
+            else:
+                for sheet_name, df in sheets.items():
+                    sheet_matches = self.analyze_sheet(sheet_name, df)
+                    self.matches.extend(sheet_matches)
+            
+            self.matches.sort(key=attrgetter('score'), reverse=True)
+            return self.matches
+        finally:
+            # Don't keep row texts alive after the analysis
+            self._keyword_memo.clear()
+
+
+def _analyze_sheet_worker(excel_path: str, sheet_name: str, df: pd.DataFrame) -> List[ProjectMatch]:
+    """Analyze one sheet in a worker process (module-level so it can be pickled)"""
+    return ProjectAnalyzer(excel_path).analyze_sheet(sheet_name, df)
+
+
+def _excel_cell(cell):
+    """Cell value as pandas' openpyxl reader converts it"""
+    if cell.value is None:
+        return ''
+    if cell.data_type == 'e':  # openpyxl TYPE_ERROR
+        return np.nan
+    if cell.data_type == 'n':  # openpyxl TYPE_NUMERIC
+        value = int(cell.value)
+        return value if value == cell.value else float(cell.value)
+    return cell.value
+
+
+def _trim_row(row: List) -> Tuple:
+    """Drop the empty cells read-only worksheets pad rows with, as pd.read_excel does"""
+    end = len(row)
+    while end and row[end - 1] == '':
+        end -= 1
+    return tuple(row[:end])
+
+
+def _column_names(header_row: Tuple) -> List:
+    """Header cells as pd.read_excel names them: blanks become 'Unnamed: i', repeats get '.1', '.2'"""
+    names = []
+    seen = {}
+    
+    for i, value in enumerate(header_row):
+        name = f"Unnamed: {i}" if value == '' else value
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    
+    return names
+
+
+def _unify_numeric_columns(chunk_results: List[Tuple[Dict, List[ProjectMatch]]]):
+    """Make streamed values numeric the way read_excel infers a column over the whole sheet
+    
+    A column that is float in any chunk (a gap or a fraction) and numeric in all of them is
+    float for read_excel, while the chunks without gaps parsed it as int or bool.
+    """
+    kinds = {}
+    for column_kinds, _ in chunk_results:
+        for column, kind in column_kinds.items():
+            kinds.setdefault(column, set()).add(kind)
+    
+    float_columns = [
+        column for column, column_kind in kinds.items()
+        if 'f' in column_kind and column_kind <= {'b', 'i', 'u', 'f'}
+    ]
+    
+    for column_kinds, chunk_matches in chunk_results:
+        columns = [column for column in float_columns if column_kinds.get(column) in ('b', 'i', 'u')]
+        for match in chunk_matches:
+            for column in columns:
+                match.project_data[column] = float(match.project_data[column])
+
+
+def _chunk_frame(rows: List[Dict], start: int, columns: List) -> pd.DataFrame:
+    """DataFrame of streamed rows, parsed like pd.read_excel parses a sheet
+    
+    Goes through the same TextParser, so default NA strings ('N/A', 'null', '#N/A', ...)
+    become NaN. Rows are indexed by their position in the sheet and get every one of
+    `columns`, blank or not. Dtypes are inferred per chunk; _unify_numeric_columns lines
+    them up across chunks afterwards.
+    """
+    data = [[row.get(name, '') for name in columns] for row in rows]
+    
+    with TextParser(data, names=columns, header=None, skip_blank_lines=False) as parser:
+        df = parser.read()
+    
+    df.index = pd.RangeIndex(start, start + len(df))
+    return df
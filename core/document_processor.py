@@ -7,10 +7,27 @@ This module handles:
 - PDF support for Horizon Europe work programme documents
 """
 
+import mmap
+import multiprocessing
 import os
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
-import re
+from typing import Dict, Generator, Iterator, List, Optional, Tuple
+
+from .regex import re2
+
+# Fast PDF text extraction (MuPDF bindings), preferred when installed
+try:
+    import pymupdf
+    PYMUPDF_SUPPORT = True
+except ImportError:
+    try:
+        import fitz as pymupdf
+        PYMUPDF_SUPPORT = True
+    except ImportError:
+        PYMUPDF_SUPPORT = False
 
 # PDF processing
 try:
@@ -21,19 +38,36 @@ except ImportError:
         from PyPDF2 import PdfReader
         PDF_SUPPORT = True
     except ImportError:
-        PDF_SUPPORT = False
-        print("PDF support not available. Install with: pip install pypdf")
+        PDF_SUPPORT = PYMUPDF_SUPPORT
+        if not PDF_SUPPORT:
+            print("PDF support not available. Install with: pip install pypdf")
+
+
+# Text documents smaller than this in total are parsed in-process: starting worker
+# processes costs more than parsing them (PDFs always use the workers)
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
+# PDFs with at least this many pages are extracted in page ranges across processes (PyMuPDF only)
+PDF_PARALLEL_MIN_PAGES = 64
+
+# Horizon project codes
+# Matches: HORIZON-XXX-YYYY-...-NN-NN or HORIZON-XXX-YYYY-NN
+_PROJECT_RE = re2.compile(r'(HORIZON-[A-Z0-9]+-[0-9]{4}(?:-[0-9]{4})?(?:-[A-Z0-9-]+)*)')
 
 
 class ClusterProject:
     """Represents a single project within a cluster document"""
     
+    __slots__ = ('code', 'title', 'description', 'cluster_name', 'full_text', 'full_text_lower')
+    
     def __init__(self, code: str, title: str, description: str, cluster_name: str):
-        self.code = code
+        # Interned: codes and cluster names repeat and are compared in filter/sort loops
+        self.code = sys.intern(code)
         self.title = title
         self.description = description
-        self.cluster_name = cluster_name
+        self.cluster_name = sys.intern(cluster_name)
         self.full_text = f"{code}\n{title}\n{description}"
+        self.full_text_lower = self.full_text.lower()
     
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
@@ -46,66 +80,147 @@ class ClusterProject:
         }
 
 
+class _ProjectReader:
+    """Collects the title and description of one project from its text, fed in pieces
+    
+    Pieces must end at line breaks (or at the end of the project's text).
+    """
+    
+    def __init__(self, code: str):
+        self.code = code
+        self.title: Optional[str] = None
+        self.description_lines: List[str] = []
+        self._description_len = 0  # len('\n'.join(description_lines)), kept up to date
+        self._done = False
+    
+    def feed(self, text: str):
+        """Read more of the project's text"""
+        if self._done:
+            return
+        
+        for line in text.split('\n'):
+            line = line.strip()
+            if not line:
+                continue
+            
+            if self.title is None:
+                # First substantial line is the title
+                self.title = line[:200]  # Limit title length
+                continue
+            
+            # Rest is description
+            # Stop at certain markers or if too long
+            if self._description_len > 2000 or line.startswith('HORIZON-'):  # Another project started
+                self._done = True
+                return
+            
+            self._description_len += len(line) + (1 if self.description_lines else 0)
+            self.description_lines.append(line)
+
+
 class ClusterDocument:
     """Represents a cluster document containing multiple projects"""
     
     def __init__(self, file_path: Path):
         self.file_path = file_path
-        self.cluster_name = file_path.stem
-        self.content = self._load_content()
+        self.cluster_name = sys.intern(file_path.stem)
         self.projects: List[ClusterProject] = self._extract_projects()
     
-    def _load_content(self) -> str:
-        """Load document content from various formats"""
+    def __setstate__(self, state: Dict):
+        """Restore a document parsed in a worker process, interning its names in this process"""
+        self.__dict__.update(state)
+        self.cluster_name = sys.intern(self.cluster_name)
+        for project in self.projects:
+            project.code = sys.intern(project.code)
+            project.cluster_name = self.cluster_name
+    
+    def load_content(self) -> str:
+        """Read the full document text from disk
+        
+        Not kept in memory: projects are extracted page by page, so every call re-reads
+        (and for PDFs re-extracts) the whole file.
+        """
+        return '\n'.join(self._iter_pages())
+    
+    def _iter_pages(self) -> Iterator[str]:
+        """Yield the non-empty text of each page (a text file is one page)
+        
+        The document text is these pages joined with newlines.
+        """
         file_extension = self.file_path.suffix.lower()
         
         if file_extension == '.pdf':
-            return self._load_pdf()
+            yield from self._iter_pdf_pages()
         else:
-            return self._load_text_file()
+            text = self._load_text_file()
+            if text:
+                yield text
     
     def _load_text_file(self) -> str:
         """Load content from text files (.txt, .md)"""
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        except UnicodeDecodeError:
-            # Try with different encoding
-            try:
-                with open(self.file_path, 'r', encoding='latin-1') as f:
-                    return f.read()
-            except Exception as e:
-                print(f"   Error loading {self.file_path.name}: {e}")
-                return ""
+            # Decode straight from the memory-mapped file, without reading it into a bytes copy first
+            with open(self.file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return ""
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    try:
+                        text = str(mm, 'utf-8')
+                    except UnicodeDecodeError:
+                        # Try with different encoding
+                        text = str(mm, 'latin-1')
         except Exception as e:
             print(f"   Error loading {self.file_path.name}: {e}")
             return ""
+        
+        # Universal newlines, like reading in text mode
+        return text.replace('\r\n', '\n').replace('\r', '\n')
     
-    def _load_pdf(self) -> str:
-        """Load content from PDF files"""
+    def _iter_pdf_pages(self) -> Iterator[str]:
+        """Yield the text of PDF pages"""
         if not PDF_SUPPORT:
             print(f"   PDF support not available for {self.file_path.name}")
-            return ""
+            return
+        
+        if PYMUPDF_SUPPORT:
+            yield from self._iter_pdf_pages_pymupdf()
+            return
         
         try:
             reader = PdfReader(self.file_path)
-            text_content = []
+            total_chars = yield from _count_chars(_iter_pypdf_pages(reader))
+            print(f"Extracted {len(reader.pages)} pages, {total_chars} characters")
+            
+        except Exception as e:
+            print(f"Error reading PDF {self.file_path.name}: {e}")
+    
+    def _iter_pdf_pages_pymupdf(self) -> Iterator[str]:
+        """Yield the text of PDF pages with PyMuPDF (much faster than pypdf)"""
+        try:
+            with pymupdf.open(str(self.file_path)) as doc:
+                page_count = doc.page_count
             
-            for page_num, page in enumerate(reader.pages, 1):
-                try:
-                    text = page.extract_text()
-                    if text:
-                        text_content.append(text)
-                except Exception as e:
-                    print(f"Error extracting page {page_num}: {e}")
+            workers = min(os.cpu_count() or 1, 8) if page_count >= PDF_PARALLEL_MIN_PAGES else 1
+            # Documents loaded in worker processes already run in parallel with each other
+            if workers > 1 and multiprocessing.parent_process() is None:
+                # Each process opens its own handle: MuPDF documents can't be shared across threads
+                bounds = [page_count * i // workers for i in range(workers + 1)]
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    shards = executor.map(
+                        _extract_pdf_pages,
+                        [str(self.file_path)] * workers,
+                        bounds[:-1],
+                        bounds[1:]
+                    )
+                    pages = (text for shard in shards for text in shard)
+                    total_chars = yield from _count_chars(pages)
+            else:
+                total_chars = yield from _count_chars(_iter_pdf_range(str(self.file_path), 0, page_count))
             
-            full_text = '\n'.join(text_content)
-            print(f"Extracted {len(reader.pages)} pages, {len(full_text)} characters")
-            return full_text
+            print(f"Extracted {page_count} pages, {total_chars} characters")
             
         except Exception as e:
             print(f"Error reading PDF {self.file_path.name}: {e}")
-            return ""
     
     def _extract_projects(self) -> List[ClusterProject]:
         """Extract individual projects from cluster document
@@ -114,68 +229,58 @@ class ClusterDocument:
         HORIZON-CL4-2024-DIGITAL-EMERGING-01-01
         Project Title
         Description...
-        """
-        if not self.content:
-            return []
         
+        Pages are scanned one at a time; only the lines of the project being read are kept.
+        Codes never contain a newline, so none can span two pages.
+        """
         projects = []
+        code_count = 0
+        has_content = False
+        current = None  # Project whose text is being read
         
-        # Pattern to match Horizon project codes
-        # Matches: HORIZON-XXX-YYYY-...-NN-NN or HORIZON-XXX-YYYY-NN
-        project_pattern = r'(HORIZON-[A-Z0-9]+-[0-9]{4}(?:-[0-9]{4})?(?:-[A-Z0-9-]+)*)'
+        for page in self._iter_pages():
+            has_content = True
+            position = 0
+            
+            # Find all project codes in the page
+            for match in _PROJECT_RE.finditer(page):
+                # The text before the code ends the previous project
+                if current is not None:
+                    current.feed(page[position:match.start()])
+                    self._add_project(projects, current)
+                
+                code_count += 1
+                current = _ProjectReader(match.group(1).strip())
+                position = match.end()
+            
+            # The rest of the page (and the next pages) belong to the last project found
+            if current is not None:
+                current.feed(page[position:])
         
-        # Find all project codes in the document
-        matches = list(re.finditer(project_pattern, self.content))
+        if not has_content:
+            return []
         
-        if not matches:
+        if code_count == 0:
             print(f"   No HORIZON project codes found in {self.file_path.name}")
             return []
         
-        print(f"Found {len(matches)} HORIZON codes")
-        
-        # Extract content for each project
-        for i, match in enumerate(matches):
-            project_code = match.group(1).strip()
-            start_pos = match.end()
-            
-            # Determine end position (next project or end of document)
-            if i + 1 < len(matches):
-                end_pos = matches[i + 1].start()
-            else:
-                end_pos = len(self.content)
-            
-            # Extract project content
-            project_content = self.content[start_pos:end_pos].strip()
-            
-            # Extract title and description
-            lines = [line.strip() for line in project_content.split('\n') if line.strip()]
-            
-            if lines:
-                # First substantial line is the title
-                title = lines[0][:200]  # Limit title length
-                
-                # Rest is description
-                description_lines = []
-                for line in lines[1:]:
-                    # Stop at certain markers or if too long
-                    if len('\n'.join(description_lines)) > 2000:
-                        break
-                    if line.startswith('HORIZON-'):  # Another project started
-                        break
-                    description_lines.append(line)
-                
-                description = '\n'.join(description_lines)
-                
-                project = ClusterProject(
-                    code=project_code,
-                    title=title,
-                    description=description,
-                    cluster_name=self.cluster_name
-                )
-                projects.append(project)
+        print(f"Found {code_count} HORIZON codes")
+        self._add_project(projects, current)
         
         return projects
     
+    def _add_project(self, projects: List[ClusterProject], reader: '_ProjectReader'):
+        """Append the project read by reader, unless it has no text at all"""
+        if reader.title is None:
+            return
+        
+        projects.append(ClusterProject(
+            code=reader.code,
+            title=reader.title,
+            description='\n'.join(reader.description_lines),
+            cluster_name=self.cluster_name
+        ))
+    
     def get_project_count(self) -> int:
         """Get number of projects in this document"""
         return len(self.projects)
@@ -187,11 +292,19 @@ class ClusterDocumentManager:
     def __init__(self, clusters_folder: str):
         self.clusters_folder = Path(clusters_folder)
         self.documents: List[ClusterDocument] = []
+        self.fingerprint: Tuple = ()
+        self._code_index: Dict[str, ClusterProject] = {}
+        self._all_projects: Tuple[ClusterProject, ...] = ()
+        self.cluster_names: Tuple[str, ...] = ()
         self.load_documents()
     
     def load_documents(self):
         """Load all documents from clusters folder"""
         self.documents = []
+        self.fingerprint = ()
+        self._code_index = {}
+        self._all_projects = ()
+        self.cluster_names = ()
         
         if not self.clusters_folder.exists():
             print(f"Clusters folder not found: {self.clusters_folder}")
@@ -211,31 +324,42 @@ class ClusterDocumentManager:
         if not PDF_SUPPORT:
             print(f"PDF support not available. Install with: pip install pypdf")
         
-        loaded_count = 0
+        candidate_files = []
         for file_path in files_found:
             if file_path.is_file() and file_path.suffix.lower() in supported_extensions:
-                print(f" Processing: {file_path.name}")
-                
                 # Skip PDFs if no support
                 if file_path.suffix.lower() == '.pdf' and not PDF_SUPPORT:
                     print(f"   Skipped PDF (install pypdf): {file_path.name}")
                     continue
-                
-                try:
-                    doc = ClusterDocument(file_path)
-                    if doc.projects:  # Only add if projects were found
-                        self.documents.append(doc)
-                        loaded_count += 1
-                        print(f"   Loaded: {file_path.name} ({len(doc.projects)} projects)")
-                    else:
-                        print(f"   No valid projects extracted from: {file_path.name}")
-                except Exception as e:
-                    print(f"   Error processing {file_path.name}: {e}")
-                    import traceback
-                    traceback.print_exc()
+                candidate_files.append(file_path)
             elif file_path.is_file():
                 print(f" Skipped: {file_path.name} (unsupported format)")
         
+        workers = min(len(candidate_files), os.cpu_count() or 1)
+        has_pdf = any(file_path.suffix.lower() == '.pdf' for file_path in candidate_files)
+        if workers > 1 and (has_pdf or _total_size(candidate_files) >= PARALLEL_MIN_BYTES):
+            # Files are independent: parse them in separate processes (map keeps the file order)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_load_document_worker, candidate_files))
+        else:
+            results = [_load_document_worker(file_path) for file_path in candidate_files]
+        
+        loaded_count = 0
+        for file_path, (doc, error) in zip(candidate_files, results):
+            if error is not None:
+                print(f"   Error processing {file_path.name}: {error}")
+            elif doc.projects:  # Only add if projects were found
+                self.documents.append(doc)
+                loaded_count += 1
+                print(f"   Loaded: {file_path.name} ({len(doc.projects)} projects)")
+            else:
+                print(f"   No valid projects extracted from: {file_path.name}")
+        
+        self.fingerprint = self._compute_fingerprint()
+        self._code_index = self._build_code_index()
+        self._all_projects = tuple(project for doc in self.documents for project in doc.projects)
+        self.cluster_names = tuple(sorted({doc.cluster_name for doc in self.documents}))
+        
         if loaded_count == 0:
             print(f"\nNo valid cluster documents loaded")
             print(f"Add .txt, .md, or .pdf files with HORIZON project codes")
@@ -246,20 +370,38 @@ class ClusterDocumentManager:
             total_projects = sum(len(doc.projects) for doc in self.documents)
             print(f"Total projects extracted: {total_projects}")
     
-    def get_all_projects(self) -> List[ClusterProject]:
-        """Get all projects from all cluster documents"""
-        all_projects = []
+    def _compute_fingerprint(self) -> Tuple:
+        """Identify the loaded documents by file path, size and modification time
+        
+        Used as a cheap cache key for results derived from the cluster documents.
+        """
+        fingerprint = []
         for doc in self.documents:
-            all_projects.extend(doc.projects)
-        return all_projects
+            try:
+                stat = doc.file_path.stat()
+                fingerprint.append((str(doc.file_path), stat.st_size, stat.st_mtime_ns))
+            except OSError:
+                fingerprint.append((str(doc.file_path), None, None))
+        return tuple(fingerprint)
     
-    def get_project_by_code(self, code: str) -> Optional[ClusterProject]:
-        """Find a project by its code"""
+    def _build_code_index(self) -> Dict[str, ClusterProject]:
+        """Map lowercased project codes to projects (the first one wins when a code repeats)"""
+        code_index = {}
         for doc in self.documents:
             for project in doc.projects:
-                if project.code.lower() == code.lower():
-                    return project
-        return None
+                code_index.setdefault(project.code.lower(), project)
+        return code_index
+    
+    def get_all_projects(self) -> Tuple[ClusterProject, ...]:
+        """Get all projects from all cluster documents
+        
+        Collected once per load_documents; the tuple is shared, not copied.
+        """
+        return self._all_projects
+    
+    def get_project_by_code(self, code: str) -> Optional[ClusterProject]:
+        """Find a project by its code"""
+        return self._code_index.get(code.lower())
     
     def search_by_keywords(self, keywords: List[str]) -> List[Dict]:
         """Search for keywords in all cluster projects
@@ -271,7 +413,7 @@ class ClusterDocumentManager:
         for doc in self.documents:
             for project in doc.projects:
                 matched_keywords = []
-                text_lower = project.full_text.lower()
+                text_lower = project.full_text_lower
                 
                 for keyword in keywords:
                     if keyword.lower() in text_lower:
@@ -309,4 +451,68 @@ class ClusterDocumentManager:
                 'projects': project_count
             })
         
-        return stats
\ No newline at end of file
+        return stats
+
+
+def _iter_pypdf_pages(reader: "PdfReader") -> Iterator[str]:
+    """Yield the text of the pages of a pypdf reader, skipping empty pages"""
+    for page_num, page in enumerate(reader.pages, 1):
+        try:
+            text = page.extract_text()
+            if text:
+                yield text
+        except Exception as e:
+            print(f"Error extracting page {page_num}: {e}")
+
+
+def _iter_pdf_range(file_path: str, start: int, end: int) -> Iterator[str]:
+    """Yield the text of pages [start, end) of a PDF with PyMuPDF, skipping empty pages"""
+    with pymupdf.open(file_path) as doc:
+        for page_index in range(start, end):
+            try:
+                text = doc.load_page(page_index).get_text("text")
+                if text:
+                    yield text
+            except Exception as e:
+                print(f"Error extracting page {page_index + 1}: {e}")
+
+
+def _extract_pdf_pages(file_path: str, start: int, end: int) -> List[str]:
+    """Text of pages [start, end) of a PDF with PyMuPDF, skipping empty pages
+    
+    Module-level so page ranges can be extracted in worker processes.
+    """
+    return list(_iter_pdf_range(file_path, start, end))
+
+
+def _count_chars(pages: Iterator[str]) -> Generator[str, None, int]:
+    """Yield pages through, then return the length of their newline-joined text"""
+    total_chars = -1
+    for text in pages:
+        total_chars += len(text) + 1
+        yield text
+    return max(total_chars, 0)
+
+
+def _total_size(files: List[Path]) -> int:
+    """Combined size in bytes of the given files; unreadable ones count as empty"""
+    total = 0
+    for file_path in files:
+        try:
+            total += file_path.stat().st_size
+        except OSError:
+            pass
+    return total
+
+
+def _load_document_worker(file_path: Path) -> Tuple[Optional[ClusterDocument], Optional[str]]:
+    """Parse one cluster document, possibly in a worker process (module-level so it can be pickled)
+    
+    Returns (document, None), or (None, error message) if parsing failed.
+    """
+    print(f" Processing: {file_path.name}")
+    try:
+        return ClusterDocument(file_path), None
+    except Exception as e:
+        traceback.print_exc()
+        return None, str(e)
@@ -0,0 +1,45 @@
+"""Aho-Corasick keyword automaton
+
+This module:
+- Builds one automaton over a list of keywords (requires pyahocorasick)
+- Finds every keyword contained in a text in a single pass
+- Reports overlapping keywords too ('zk' and 'zk-snark'), like substring checks
+"""
+
+from typing import List, Optional, Set
+
+try:
+    import ahocorasick
+    AHOCORASICK_SUPPORT = True
+except ImportError:
+    AHOCORASICK_SUPPORT = False
+
+
+def build_keyword_automaton(keywords: List[str]) -> Optional["ahocorasick.Automaton"]:
+    """Build an automaton mapping each lowercased keyword to its positions in `keywords`
+
+    Returns None when pyahocorasick is not installed.
+    """
+    if not AHOCORASICK_SUPPORT:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for index, keyword in enumerate(keywords):
+        keyword_lower = keyword.lower()
+        if keyword_lower:
+            # The same keyword may be listed more than once
+            automaton.add_word(keyword_lower, automaton.get(keyword_lower, ()) + (index,))
+
+    if len(automaton) == 0:
+        return None
+
+    automaton.make_automaton()
+    return automaton
+
+
+def find_keywords(automaton: "ahocorasick.Automaton", text_lower: str) -> Set[int]:
+    """Get the positions of all keywords found in an already lowercased text"""
+    found = set()
+    for _, indices in automaton.iter(text_lower):
+        found.update(indices)
+    return found
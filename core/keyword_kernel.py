@@ -0,0 +1,111 @@
+"""Compiled keyword scan
+
+This module:
+- Packs keywords and texts into flat UTF-8 byte buffers with offsets
+- Scans every row for every keyword in one native loop (requires numba)
+- Matches plain substrings, overlapping keywords included, like substring checks
+"""
+
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_SUPPORT = True
+except ImportError:
+    NUMBA_SUPPORT = False
+
+
+class KeywordTable(NamedTuple):
+    """Keywords packed for the kernel, bucketed by their first two bytes"""
+    data: np.ndarray
+    offsets: np.ndarray
+    bucket_starts: np.ndarray
+    bucket_keywords: np.ndarray
+
+
+def _pack(texts: List[str]):
+    """Concatenate UTF-8 encoded texts into one byte buffer plus start offsets"""
+    encoded = [text.encode('utf-8', 'surrogatepass') for text in texts]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(chunk) for chunk in encoded], out=offsets[1:])
+    data = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    return data, offsets
+
+
+def build_keyword_table(keywords: List[str]) -> Optional[KeywordTable]:
+    """Pack lowercased keywords for keyword_hits_compiled
+
+    Returns None when numba is not installed or there are no keywords.
+    """
+    if not NUMBA_SUPPORT:
+        return None
+
+    keywords_lower = [keyword.lower() for keyword in keywords]
+    if not any(keywords_lower):
+        return None
+
+    data, offsets = _pack(keywords_lower)
+
+    # Keyword positions grouped by their first two bytes (first byte only for one-byte keywords,
+    # in the 256 buckets past the two-byte ones), so each text position only tries likely keywords
+    lengths = np.diff(offsets)
+    prefixes = np.array([
+        int(data[offsets[i]]) * 256 + int(data[offsets[i] + 1]) if lengths[i] >= 2
+        else 65536 + int(data[offsets[i]]) if lengths[i] == 1
+        else -1
+        for i in range(len(keywords_lower))
+    ], dtype=np.int64)
+    order = np.argsort(prefixes, kind='stable')
+    order = order[prefixes[order] >= 0]
+    bucket_starts = np.searchsorted(prefixes[order], np.arange(65536 + 257)).astype(np.int64)
+
+    return KeywordTable(data, offsets, bucket_starts, order.astype(np.int64))
+
+
+if NUMBA_SUPPORT:
+    # Serial on purpose: analyze_all already spreads sheets over forked worker processes,
+    # and numba's threading layers can deadlock a process forked after they started
+    @njit(cache=True)
+    def _scan(text_data, text_offsets, kw_data, kw_offsets, bucket_starts, bucket_keywords, hits):
+        for row in range(len(text_offsets) - 1):
+            start = text_offsets[row]
+            end = text_offsets[row + 1]
+            for pos in range(start, end):
+                first = np.int64(text_data[pos])
+                for slot in range(bucket_starts[65536 + first], bucket_starts[65537 + first]):
+                    hits[row, bucket_keywords[slot]] = True
+                if pos + 1 == end:
+                    break
+                prefix = first * 256 + text_data[pos + 1]
+                for slot in range(bucket_starts[prefix], bucket_starts[prefix + 1]):
+                    kw = bucket_keywords[slot]
+                    if hits[row, kw]:
+                        continue
+                    kw_start = kw_offsets[kw]
+                    kw_len = kw_offsets[kw + 1] - kw_start
+                    if pos + kw_len > end:
+                        continue
+                    matched = True
+                    for j in range(2, kw_len):
+                        if text_data[pos + j] != kw_data[kw_start + j]:
+                            matched = False
+                            break
+                    if matched:
+                        hits[row, kw] = True
+
+
+def keyword_hits_compiled(table: KeywordTable, texts_lower: List[str]) -> np.ndarray:
+    """Boolean matrix (texts x keywords) of keywords found in already lowercased texts"""
+    hits = np.zeros((len(texts_lower), len(table.offsets) - 1), dtype=np.bool_)
+    if len(texts_lower) == 0:
+        return hits
+
+    text_data, text_offsets = _pack(texts_lower)
+    _scan(
+        text_data, text_offsets,
+        table.data, table.offsets, table.bucket_starts, table.bucket_keywords,
+        hits
+    )
+    return hits
@@ -6,9 +6,13 @@ This module:
 - Identifies common keywords and project codes
 """
 
-from typing import List, Dict, Tuple, Set
+from typing import List, Dict, Tuple, Set, FrozenSet, Optional
+import heapq
+import numpy as np
 from .models import ProjectMatch
 from .document_processor import ClusterDocumentManager, ClusterProject
+from .regex import re2
+from .keyword_automaton import build_keyword_automaton, find_keywords
 from config.keywords import (
     BLOCKCHAIN_KEYWORDS,
     PRIVACY_KEYWORDS,
@@ -16,12 +20,19 @@ from config.keywords import (
     AI_KEYWORDS,
     IOT_KEYWORDS
 )
-import re
+
+# Excel projects scored per matrix product in batch_match_all (bounds the score matrix size)
+BATCH_BLOCK_ROWS = 512
+
+# Project codes, in any letter case
+_CODE_RE = re2.compile(r'(?i)HORIZON-[A-Z0-9-]+')
 
 
 class MatchResult:
     """Result of matching Excel project with cluster project"""
     
+    __slots__ = ('cluster_project', 'score', 'matched_terms')
+    
     def __init__(self, cluster_project: ClusterProject, score: int, matched_terms: List[str]):
         self.cluster_project = cluster_project
         self.score = score
@@ -39,9 +50,71 @@ class MatchResult:
 class ClusterMatcher:
     """Matches Excel projects with cluster documents"""
     
-    def __init__(self, cluster_manager: ClusterDocumentManager):
+    def __init__(self, cluster_manager: ClusterDocumentManager, enable_cache: bool = True):
         self.cluster_manager = cluster_manager
         self.all_keywords = self._collect_all_keywords()
+        self._keywords_lower = [keyword.lower() for keyword in self.all_keywords]
+        
+        # Single-pass keyword matcher (None without pyahocorasick)
+        self._automaton = build_keyword_automaton(self.all_keywords)
+        
+        # Cluster-side data, invariant while the cluster documents don't change
+        self.enable_cache = enable_cache
+        self._cluster_cache: Optional[Tuple] = None
+        if enable_cache:
+            self.rebuild_cache()
+    
+    def rebuild_cache(self):
+        """Precompute the cluster side of matching
+        
+        Call again after cluster_manager.documents change.
+        """
+        self._cluster_cache = self._build_cluster_cache()
+    
+    def _build_cluster_cache(self) -> Tuple:
+        """Index the cluster projects for matching
+        
+        Returns:
+            (cluster_index, code_positions, cluster_matrix): (project, lowercased text, keyword hits)
+            per project in document order, index positions by lowercased project code, and the
+            keyword incidence matrix of the projects
+        """
+        cluster_index = []
+        code_positions: Dict[str, List[int]] = {}
+        
+        for doc in self.cluster_manager.documents:
+            for cluster_project in doc.projects:
+                text_lower = cluster_project.full_text_lower
+                code_positions.setdefault(cluster_project.code.lower(), []).append(len(cluster_index))
+                cluster_index.append((cluster_project, text_lower, self._find_keywords(text_lower)))
+        
+        cluster_matrix = self._keyword_matrix([hits for _, _, hits in cluster_index])
+        return cluster_index, code_positions, cluster_matrix
+    
+    def _get_cluster_cache(self) -> Tuple:
+        """The cluster index, rebuilt on every call when caching is disabled"""
+        if self._cluster_cache is not None:
+            return self._cluster_cache
+        return self._build_cluster_cache()
+    
+    def _find_keywords(self, text_lower: str) -> FrozenSet[int]:
+        """Positions in all_keywords of the keywords found in a lowercased text"""
+        if self._automaton is not None:
+            return frozenset(find_keywords(self._automaton, text_lower))
+        
+        return frozenset(
+            index for index, keyword_lower in enumerate(self._keywords_lower)
+            if keyword_lower in text_lower
+        )
+    
+    def _keyword_matrix(self, hit_sets: List[FrozenSet[int]]) -> np.ndarray:
+        """Keyword incidence matrix (texts x all_keywords) as float32 0/1, ready for BLAS products"""
+        matrix = np.zeros((len(hit_sets), len(self.all_keywords)), dtype=np.float32)
+        
+        for row, hits in enumerate(hit_sets):
+            matrix[row, list(hits)] = 1
+        
+        return matrix
     
     def _collect_all_keywords(self) -> List[str]:
         """Collect all keywords from all categories"""
@@ -64,30 +137,53 @@ class ClusterMatcher:
         """
         excel_text = self._extract_excel_text(excel_match)
         excel_codes = self._extract_project_codes(excel_text)
+        excel_hits = self._find_keywords(excel_text)
         
-        matching_clusters = []
+        cluster_index, code_positions, _ = self._get_cluster_cache()
+        
+        # Projects whose code appears in the Excel text, found by code lookup
+        code_matched = {
+            position
+            for code in excel_codes
+            for position in code_positions.get(code, ())
+        }
+        
+        # Bounded min-heap of the 10 best (score, -position) keys seen so far, so
+        # equal scores keep document order
+        top_heap = []
+        total_matches = 0
         
         # Check each cluster project
-        for doc in self.cluster_manager.documents:
-            for cluster_project in doc.projects:
-                score, matched_terms = self._calculate_match_score(
-                    excel_text,
-                    excel_codes,
-                    cluster_project
-                )
-                
-                if score > 0:
-                    match_result = MatchResult(cluster_project, score, matched_terms)
-                    matching_clusters.append(match_result)
+        for position, (cluster_project, _, cluster_hits) in enumerate(cluster_index):
+            score, matched_terms = self._calculate_match_score(
+                excel_text,
+                excel_codes,
+                cluster_project,
+                excel_hits,
+                cluster_hits,
+                position in code_matched
+            )
+            
+            if score > 0:
+                total_matches += 1
+                entry = (score, -position, cluster_project, matched_terms)
+                if len(top_heap) < 10:
+                    heapq.heappush(top_heap, entry)
+                elif entry[:2] > top_heap[0][:2]:
+                    heapq.heapreplace(top_heap, entry)
         
-        # Sort by score (highest first)
-        matching_clusters.sort(key=lambda x: x.score, reverse=True)
+        # Highest score first
+        top_heap.sort(reverse=True)
+        top_matches = [
+            MatchResult(cluster_project, score, matched_terms)
+            for score, _, cluster_project, matched_terms in top_heap
+        ]
         
         return {
             'excel_match': excel_match,
-            'cluster_matches': matching_clusters[:10],  # Top 10 matches
-            'total_matches': len(matching_clusters),
-            'has_matches': len(matching_clusters) > 0
+            'cluster_matches': top_matches,
+            'total_matches': total_matches,
+            'has_matches': total_matches > 0
         }
     
     def _extract_excel_text(self, excel_match: ProjectMatch) -> str:
@@ -102,15 +198,16 @@ class ClusterMatcher:
     
     def _extract_project_codes(self, text: str) -> Set[str]:
         """Extract Horizon project codes from text"""
-        pattern = r'HORIZON-[A-Z0-9-]+'
-        codes = re.findall(pattern, text.upper())
-        return set(code.lower() for code in codes)
+        return set(code.lower() for code in _CODE_RE.findall(text))
     
     def _calculate_match_score(
         self, 
         excel_text: str, 
         excel_codes: Set[str], 
-        cluster_project: ClusterProject
+        cluster_project: ClusterProject,
+        excel_hits: Optional[FrozenSet[int]] = None,
+        cluster_hits: Optional[FrozenSet[int]] = None,
+        code_match: Optional[bool] = None
     ) -> Tuple[int, List[str]]:
         """Calculate match score between Excel and cluster project
         
@@ -118,6 +215,8 @@ class ClusterMatcher:
         - Exact code match: +20 points
         - Each keyword match: +2 points
         
+        excel_hits, cluster_hits and code_match are computed here unless already known.
+        
         Returns:
             (score, list of matched terms)
         """
@@ -125,20 +224,24 @@ class ClusterMatcher:
         matched_terms = []
         
         # Check for exact code match (highest priority)
-        cluster_code = cluster_project.code.lower()
-        if cluster_code in excel_codes:
+        if code_match is None:
+            code_match = cluster_project.code.lower() in excel_codes
+        if code_match:
             score += 20
             matched_terms.append(f"CODE:{cluster_project.code}")
         
         # Check keyword matches
-        cluster_text = cluster_project.full_text.lower()
+        if excel_hits is None:
+            excel_hits = self._find_keywords(excel_text)
+        if cluster_hits is None:
+            cluster_hits = self._find_keywords(cluster_project.full_text_lower)
         
-        for keyword in self.all_keywords:
-            keyword_lower = keyword.lower()
-            if keyword_lower in excel_text and keyword_lower in cluster_text:
-                score += 2
-                if keyword not in matched_terms:
-                    matched_terms.append(keyword)
+        # Keywords common to both texts, in keyword list order
+        for index in sorted(excel_hits & cluster_hits):
+            keyword = self.all_keywords[index]
+            score += 2
+            if keyword not in matched_terms:
+                matched_terms.append(keyword)
         
         return score, matched_terms
     
@@ -155,13 +258,33 @@ class ClusterMatcher:
         total_cluster_matches = 0
         projects_with_matches = 0
         
-        for excel_match in excel_matches:
-            match_result = self.match_excel_with_clusters(excel_match)
-            results.append(match_result)
+        cluster_index, code_positions, cluster_matrix = self._get_cluster_cache()
+        cluster_projects = [cluster_project for cluster_project, _, _ in cluster_index]
+        
+        for block_start in range(0, len(excel_matches), BATCH_BLOCK_ROWS):
+            block = excel_matches[block_start:block_start + BATCH_BLOCK_ROWS]
+            excel_texts = [self._extract_excel_text(m) for m in block]
+            excel_matrix = self._keyword_matrix([self._find_keywords(text) for text in excel_texts])
             
-            if match_result['has_matches']:
-                projects_with_matches += 1
-                total_cluster_matches += match_result['total_matches']
+            # Common keyword entries for every (Excel project, cluster project) pair at once
+            scores = 2 * (excel_matrix @ cluster_matrix.T).astype(np.int64)
+            
+            code_matched = np.zeros(scores.shape, dtype=bool)
+            for row, excel_text in enumerate(excel_texts):
+                for code in self._extract_project_codes(excel_text):
+                    code_matched[row, code_positions.get(code, [])] = True
+            scores += 20 * code_matched
+            
+            for row, excel_match in enumerate(block):
+                match_result = self._top_cluster_matches(
+                    excel_match, scores[row], code_matched[row],
+                    excel_matrix[row], cluster_matrix, cluster_projects
+                )
+                results.append(match_result)
+                
+                if match_result['has_matches']:
+                    projects_with_matches += 1
+                    total_cluster_matches += match_result['total_matches']
         
         return {
             'results': results,
@@ -174,4 +297,37 @@ class ClusterMatcher:
                     if excel_matches else 0
                 )
             }
-        }
\ No newline at end of file
+        }
+    
+    def _top_cluster_matches(
+        self,
+        excel_match: ProjectMatch,
+        scores: np.ndarray,
+        code_matched: np.ndarray,
+        excel_row: np.ndarray,
+        cluster_matrix: np.ndarray,
+        cluster_projects: List[ClusterProject]
+    ) -> Dict:
+        """Build the match_excel_with_clusters result from one row of batch scores"""
+        positive = np.flatnonzero(scores > 0)
+        # Stable, so equal scores keep document order like list.sort does
+        top = positive[np.argsort(-scores[positive], kind='stable')][:10]
+        
+        matching_clusters = []
+        for position in top:
+            cluster_project = cluster_projects[position]
+            matched_terms = [f"CODE:{cluster_project.code}"] if code_matched[position] else []
+            
+            for index in np.flatnonzero(excel_row * cluster_matrix[position]):
+                keyword = self.all_keywords[index]
+                if keyword not in matched_terms:
+                    matched_terms.append(keyword)
+            
+            matching_clusters.append(MatchResult(cluster_project, int(scores[position]), matched_terms))
+        
+        return {
+            'excel_match': excel_match,
+            'cluster_matches': matching_clusters,
+            'total_matches': len(positive),
+            'has_matches': len(positive) > 0
+        }
@@ -3,11 +3,23 @@
 from dataclasses import dataclass
 from typing import List, Dict
 
+from config.keywords import HIGH_PRIORITY_THRESHOLD, MEDIUM_PRIORITY_THRESHOLD
+
+# Columns tried for a match's title, most preferred first
+_TITLE_KEYS = ('Title', 'title', 'Project Title', 'PROJECT_TITLE', 'Call title')
+
 
 @dataclass
 class ProjectMatch:
     """Represents a matched project opportunity"""
     
+    # No per-instance __dict__: analyses can hold thousands of matches
+    __slots__ = (
+        'row_index', 'sheet_name', 'score', 'matched_keywords', 'technologies',
+        'potential_roles', 'contributions', 'project_data',
+        '_info'  # extract_project_info() result, filled on first use
+    )
+    
     row_index: int
     sheet_name: str
     score: int
@@ -20,8 +32,6 @@ class ProjectMatch:
     @property
     def priority_level(self) -> str:
         """Get priority level based on score"""
-        from config.keywords import HIGH_PRIORITY_THRESHOLD, MEDIUM_PRIORITY_THRESHOLD
-        
         if self.score >= HIGH_PRIORITY_THRESHOLD:
             return "HIGH"
         elif self.score >= MEDIUM_PRIORITY_THRESHOLD:
@@ -31,7 +41,7 @@ class ProjectMatch:
     
     def get_project_title(self) -> str:
         """Extract project title from data"""
-        for key in ['Title', 'title', 'Project Title', 'PROJECT_TITLE', 'Call title']:
+        for key in _TITLE_KEYS:
             if key in self.project_data and self.project_data[key]:
                 return str(self.project_data[key])[:100]
         return f"Project at row {self.row_index + 1}"
@@ -0,0 +1,14 @@
+"""Regex engine for the document and matcher patterns
+
+Uses google-re2 (linear-time matching) when installed, the standard re module
+otherwise; both have the same API for the patterns compiled here.
+"""
+
+import re
+
+try:
+    import re2
+    RE2_SUPPORT = True
+except ImportError:
+    re2 = re
+    RE2_SUPPORT = False
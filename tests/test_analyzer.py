@@ -0,0 +1,68 @@
+"""Vectorized sheet scoring must match the original per-row scoring"""
+
+import random
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from core.analyzer import ProjectAnalyzer, _row_texts
+
+
+def _joined_row_text(row: pd.Series) -> str:
+    """Row text as analyze_sheet originally built it, one row at a time"""
+    return ' '.join([str(row.get(col, '')) for col in row.index if pd.notna(row.get(col, ''))]).lower()
+
+
+def _random_frame(rng: random.Random, values: list, rows: int = 40, columns: int = 5) -> pd.DataFrame:
+    return pd.DataFrame({
+        f'col{c}': [rng.choice(values) for _ in range(rows)]
+        for c in range(columns)
+    })
+
+
+class RowTextsTest(unittest.TestCase):
+    
+    def assert_matches_row_join(self, df: pd.DataFrame):
+        expected = [_joined_row_text(row) for _, row in df.iterrows()]
+        self.assertEqual(_row_texts(df).tolist(), expected)
+    
+    def test_missing_cells_are_skipped(self):
+        df = pd.DataFrame([['Data', None, 'Sharing and Privacy'], [None, None, None]])
+        self.assert_matches_row_join(df)
+        
+        # 'data sharing' spans the missing cell, as it did when rows were joined one by one
+        match = ProjectAnalyzer('unused.xlsx').analyze_sheet('Sheet', df.iloc[:1])[0]
+        self.assertEqual(match.score, 5)
+    
+    def test_random_text_frames(self):
+        rng = random.Random(0)
+        values = ['data', 'sharing', 'zk', 'Smart', 'contract', '', ' ', None, np.nan, 'é IoT']
+        for _ in range(50):
+            self.assert_matches_row_join(_random_frame(rng, values))
+    
+    def test_numeric_cell_separates_text(self):
+        df = pd.DataFrame([['smart', 1, 'contract'], ['smart', np.nan, 'contract']])
+        self.assert_matches_row_join(df)
+        
+        # Only the row without the number reads 'smart contract'
+        matches = ProjectAnalyzer('unused.xlsx').analyze_sheet('Sheet', df)
+        self.assertEqual([match.row_index for match in matches], [3])
+    
+    def test_random_mixed_frames(self):
+        rng = random.Random(1)
+        cells = [
+            lambda: rng.choice(['smart', 'contract', 'web', 'é Data', None]),
+            lambda: rng.choice([1, 2, None]),
+            lambda: rng.choice([1.5, 3.0, np.nan]),
+            lambda: rng.choice([True, False]),
+            lambda: rng.choice([pd.Timestamp('2024-01-01'), pd.NaT])
+        ]
+        for _ in range(100):
+            kinds = rng.choices(cells, k=rng.randint(1, 5))
+            df = pd.DataFrame({f'col{c}': [kind() for _ in range(15)] for c, kind in enumerate(kinds)})
+            self.assert_matches_row_join(df)
+
+
+if __name__ == '__main__':
+    unittest.main()
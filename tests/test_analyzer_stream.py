@@ -0,0 +1,116 @@
+"""Streamed sheets must parse like pd.read_excel"""
+
+import datetime
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+from openpyxl import Workbook
+
+from core.analyzer import ProjectAnalyzer, _chunk_frame
+
+
+def _write_workbook(path: Path):
+    """Small sheet covering NA strings, booleans, numbers, dates and awkward headers"""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = 'Calls'
+    sheet.append(['Title', 'Open', 'Budget', 'Deadline', None, 'Title', 'Notes'])
+    sheet.append(['N/A', True, 1, datetime.datetime(2025, 3, 1), 'x', 'dup', 'null'])
+    sheet.append(['Blockchain pilot', False, 2.0, None, None, None, 'NA'])
+    sheet.append([])
+    sheet.append(['#N/A', None, 3.5, datetime.datetime(2025, 4, 1), None, 'n/a', ''])
+    sheet.append([None, True, None, None, None, None, 'ok', 'past the header'])
+    sheet.append([])
+    sheet.append([])
+    workbook.save(path)
+
+
+class LoadExcelStreamTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / 'calls.xlsx'
+        _write_workbook(self.path)
+        self.analyzer = ProjectAnalyzer(str(self.path))
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_stream_matches_read_excel(self):
+        rows = list(self.analyzer.load_excel_stream('Calls'))
+        streamed = _chunk_frame(rows, 0, list(rows[-1]))
+        
+        expected = pd.read_excel(self.path, sheet_name='Calls', engine='openpyxl')
+        pd.testing.assert_frame_equal(streamed, expected)
+        pd.testing.assert_frame_equal(streamed, self.analyzer.load_excel()['Calls'])
+    
+    def test_chunks_keep_sheet_positions(self):
+        rows = list(self.analyzer.load_excel_stream('Calls'))
+        columns = list(rows[-1])
+        chunks = [_chunk_frame(rows[:2], 0, columns), _chunk_frame(rows[2:], 2, columns)]
+        
+        self.assertEqual(
+            [index for chunk in chunks for index in chunk.index],
+            list(range(len(rows)))
+        )
+        self.assertTrue(pd.isna(chunks[0].loc[0, 'Title']))
+        self.assertTrue(pd.isna(chunks[1].loc[3, 'Title']))
+
+
+
+class ChunkedStreamTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / 'notes.xlsx'
+        
+        # 'Notes' is blank in every row of the first chunks
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = 'Calls'
+        # 'Partners' and 'Open' only have gaps in the last chunks
+        sheet.append(['Title', 'Description', 'Partners', 'Open', 'Notes'])
+        for i in range(7):
+            sheet.append([
+                f'Blockchain pilot {i}', 'smart contract and data sharing',
+                None if i == 6 else i + 2, None if i == 4 else bool(i % 2), 'late' if i == 5 else None
+            ])
+        workbook.save(self.path)
+        
+        self.analyzer = ProjectAnalyzer(str(self.path))
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_blank_column_kept_in_every_chunk(self):
+        df = self.analyzer.load_excel()['Calls']
+        expected = self.analyzer.analyze_sheet('Calls', df)
+        streamed = self.analyzer.analyze_sheet_stream('Calls', chunk_size=3)
+        
+        self.assertEqual(len(streamed), len(expected))
+        for stream_match, match in zip(streamed, expected):
+            self.assertEqual(stream_match.row_index, match.row_index)
+            self.assertEqual(stream_match.score, match.score)
+            self.assertEqual(list(stream_match.project_data), list(match.project_data))
+            pd.testing.assert_series_equal(
+                pd.Series(stream_match.project_data, dtype=object),
+                pd.Series(match.project_data, dtype=object)
+            )
+    
+    def test_numeric_columns_match_whole_sheet(self):
+        df = self.analyzer.load_excel()['Calls']
+        expected = self.analyzer.analyze_sheet('Calls', df)
+        streamed = self.analyzer.analyze_sheet_stream('Calls', chunk_size=3)
+        
+        self.assertEqual(len(streamed), len(expected))
+        for stream_match, match in zip(streamed, expected):
+            for column in ('Partners', 'Open'):
+                value, expected_value = stream_match.project_data[column], match.project_data[column]
+                self.assertEqual(type(value), type(expected_value))
+                self.assertEqual(str(value), str(expected_value))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+"""Cluster documents are only parsed in worker processes when it pays off"""
+
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from core import document_processor
+from core.document_processor import ClusterDocumentManager
+
+
+class LoadDocumentsTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp.name)
+        for i in range(3):
+            (self.folder / f'cluster{i}.txt').write_text(
+                f'HORIZON-CL3-2025-01-{i:02d}: Blockchain pilot\\nData sharing with smart contracts.\\n'
+            )
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def load(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return ClusterDocumentManager(str(self.folder))
+    
+    def test_small_text_files_load_in_process(self):
+        with mock.patch.object(document_processor, 'ProcessPoolExecutor') as executor:
+            manager = self.load()
+        executor.assert_not_called()
+        self.assertEqual(sorted(doc.file_path.name for doc in manager.documents),
+                         ['cluster0.txt', 'cluster1.txt', 'cluster2.txt'])
+    
+    def test_large_text_files_use_workers(self):
+        with mock.patch.object(document_processor, 'PARALLEL_MIN_BYTES', 1), \
+                mock.patch('os.cpu_count', return_value=2), \
+                mock.patch.object(document_processor, 'ProcessPoolExecutor') as executor:
+            executor.return_value.__enter__.return_value.map = map
+            manager = self.load()
+        executor.assert_called_once_with(max_workers=2)
+        self.assertEqual(len(manager.documents), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+"""Every keyword engine must find exactly the keywords a plain `kw in text` check finds"""
+
+import contextlib
+import io
+import random
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from config.keywords import ALL_KEYWORDS
+from core import analyzer
+from core.document_processor import ClusterDocumentManager, ClusterProject
+from core.keyword_automaton import AHOCORASICK_SUPPORT, build_keyword_automaton, find_keywords
+from core.keyword_kernel import NUMBA_SUPPORT, build_keyword_table, keyword_hits_compiled
+from core.matcher import ClusterMatcher
+from core.models import ProjectMatch
+
+# Keywords, keywords inside longer words ('tee' in 'committee'), overlapping keywords
+# ('zk' and 'zk-snark'), near misses and non-ASCII text
+_TOKENS = list(ALL_KEYWORDS) + [
+    'committee', 'zk-snarks', 'zk-snar', 'zk-', 'blockcha', 'smart-contract', 'ai-driven',
+    'privacy-preserving', 'données', 'réseau', 'straße', 'ärzte', 'ıot', 'İot', '🚀', '区块链',
+    'HORIZON-CL3-2025-01', 'x', '', '42', 'nan'
+]
+
+
+def _random_texts(seed: int, count: int = 300):
+    rng = random.Random(seed)
+    return [
+        rng.choice([' ', '', '-', '\n']).join(rng.choice(_TOKENS) for _ in range(rng.randint(0, 12))).lower()
+        for _ in range(count)
+    ]
+
+
+def _expected_hits(texts):
+    return np.array([[kw.lower() in text for kw in ALL_KEYWORDS] for text in texts], dtype=bool).reshape(
+        len(texts), len(ALL_KEYWORDS)
+    )
+
+
+class KeywordEnginesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.texts = _random_texts(0) + ['committee', 'zk-snark', 'zk', 'tee', '', 'données 🚀 zk-stark']
+        self.expected = _expected_hits(self.texts)
+
+    @unittest.skipUnless(AHOCORASICK_SUPPORT, 'pyahocorasick not installed')
+    def test_automaton(self):
+        automaton = build_keyword_automaton(list(ALL_KEYWORDS))
+        for text, expected in zip(self.texts, self.expected):
+            self.assertEqual(find_keywords(automaton, text), set(np.flatnonzero(expected)), text)
+
+    @unittest.skipUnless(NUMBA_SUPPORT, 'numba not installed')
+    def test_compiled_kernel(self):
+        table = build_keyword_table(list(ALL_KEYWORDS))
+        np.testing.assert_array_equal(keyword_hits_compiled(table, self.texts), self.expected)
+
+    @unittest.skipUnless(NUMBA_SUPPORT, 'numba not installed')
+    def test_analyzer_compiled_path(self):
+        with mock.patch.object(analyzer, 'COMPILED_MIN_ROWS', 0):
+            hits = analyzer._keyword_hits(pd.Series(self.texts))
+        np.testing.assert_array_equal(hits, self.expected)
+
+    @unittest.skipUnless(AHOCORASICK_SUPPORT, 'pyahocorasick not installed')
+    def test_analyzer_automaton_path(self):
+        memo = {}
+        with mock.patch.object(analyzer, '_KEYWORD_TABLE', None):
+            hits = analyzer._keyword_hits(pd.Series(self.texts), memo)
+            # Second pass is served from the memo
+            memo_hits = analyzer._keyword_hits(pd.Series(self.texts), memo)
+        np.testing.assert_array_equal(hits, self.expected)
+        np.testing.assert_array_equal(memo_hits, self.expected)
+
+    def test_analyzer_pandas_path(self):
+        with mock.patch.object(analyzer, '_KEYWORD_TABLE', None), \
+                mock.patch.object(analyzer, '_KEYWORD_AUTOMATON', None):
+            hits = analyzer._keyword_hits(pd.Series(self.texts))
+        np.testing.assert_array_equal(hits, self.expected)
+
+
+class BatchMatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.manager = ClusterDocumentManager(self.tmp.name)
+
+        cluster_texts = _random_texts(1, count=60)
+        projects = [
+            ClusterProject(f'HORIZON-CL3-2025-{i:02d}', text, '', 'Cluster')
+            for i, text in enumerate(cluster_texts)
+        ]
+        self.manager.documents = [SimpleNamespace(projects=projects[:30]), SimpleNamespace(projects=projects[30:])]
+        self.projects = projects
+
+        self.excel_matches = [
+            ProjectMatch(
+                row_index=i + 2, sheet_name='Calls', score=0, matched_keywords={},
+                technologies=[], potential_roles=[], contributions=[],
+                project_data={'Title': text, 'Notes': 'HORIZON-CL3-2025-01' if i % 7 == 0 else None}
+            )
+            for i, text in enumerate(_random_texts(2, count=80))
+        ]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _reference(self, matcher, excel_match):
+        """Top 10 (code, score, matched terms) scored with plain substring checks"""
+        excel_text = matcher._extract_excel_text(excel_match)
+        excel_codes = matcher._extract_project_codes(excel_text)
+        scored = []
+        for project in self.projects:
+            terms = [f'CODE:{project.code}'] if project.code.lower() in excel_codes else []
+            score = 20 * len(terms)
+            for kw in matcher.all_keywords:
+                if kw.lower() in excel_text and kw.lower() in project.full_text_lower:
+                    score += 2
+                    if kw not in terms:
+                        terms.append(kw)
+            if score > 0:
+                scored.append((project.code, score, terms))
+        # Stable sort: equal scores keep document order
+        scored.sort(key=lambda entry: -entry[1])
+        return scored[:10], len(scored)
+
+    def assert_matches_reference(self, matcher):
+        batch = matcher.batch_match_all(self.excel_matches)['results']
+        self.assertEqual(len(batch), len(self.excel_matches))
+
+        for excel_match, result in zip(self.excel_matches, batch):
+            top, total = self._reference(matcher, excel_match)
+            self.assertEqual(result['total_matches'], total)
+            self.assertEqual(
+                [(m.cluster_project.code, m.score, m.matched_terms) for m in result['cluster_matches']],
+                top
+            )
+
+    def test_batch_matches_substring_scoring(self):
+        self.assert_matches_reference(ClusterMatcher(self.manager))
+
+    def test_batch_matches_without_automaton(self):
+        matcher = ClusterMatcher(self.manager, enable_cache=False)
+        matcher._automaton = None
+        self.assert_matches_reference(matcher)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,10 +8,46 @@ This module provides:
 """
 
 import streamlit as st
-from typing import List, Dict
+from operator import attrgetter
+from typing import List, Dict, Tuple
 from core.document_processor import ClusterDocumentManager, ClusterProject
 from core.matcher import ClusterMatcher, MatchResult
 
+_SORT_KEYS = {
+    "Code": attrgetter('code'),
+    "Title": attrgetter('title'),
+    "Cluster": attrgetter('cluster_name')
+}
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_search(cluster_fingerprint: Tuple, keywords: Tuple[str, ...],
+                   _cluster_manager: ClusterDocumentManager) -> List[Tuple[int, Tuple[str, ...]]]:
+    """Keyword search results as (position in get_all_projects(), matched keywords)
+    
+    Keyed on the loaded cluster documents, so reruns with the same query skip the corpus scan.
+    """
+    positions = {id(project): i for i, project in enumerate(_cluster_manager.get_all_projects())}
+    return [
+        (positions[id(result['project'])], tuple(result['matched_keywords']))
+        for result in _cluster_manager.search_by_keywords(list(keywords))
+    ]
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_browse(cluster_fingerprint: Tuple, selected_clusters: Tuple[str, ...], sort_by: str,
+                   _cluster_manager: ClusterDocumentManager) -> Tuple[int, ...]:
+    """Positions in get_all_projects() of the projects in the selected clusters, sorted"""
+    sort_key = _SORT_KEYS.get(sort_by, _SORT_KEYS["Cluster"])
+    
+    selected = frozenset(selected_clusters)
+    # Ties fall back to the position, which keeps the order of a stable sort
+    decorated = sorted(
+        (sort_key(p), i) for i, p in enumerate(_cluster_manager.get_all_projects())
+        if p.cluster_name in selected
+    )
+    return tuple(i for _, i in decorated)
+
 
 def display_cluster_statistics(cluster_manager: ClusterDocumentManager):
     """Display overview statistics for cluster documents"""
@@ -81,8 +117,18 @@ def display_cluster_search(cluster_manager: ClusterDocumentManager):
         max_results = st.number_input("Max results", min_value=5, max_value=50, value=10)
     
     if search_query:
-        keywords = [k.strip() for k in search_query.split(',') if k.strip()]
-        results = cluster_manager.search_by_keywords(keywords)
+        keywords = tuple(k.strip() for k in search_query.split(',') if k.strip())
+        all_projects = cluster_manager.get_all_projects()
+        results = [
+            {
+                'project': all_projects[position],
+                'matched_keywords': list(matched_keywords),
+                'match_count': len(matched_keywords)
+            }
+            for position, matched_keywords in _cached_search(
+                cluster_manager.fingerprint, keywords, cluster_manager
+            )
+        ]
         
         st.write(f"**Found {len(results)} matching projects** (showing top {max_results})")
         
@@ -160,7 +206,7 @@ def display_cluster_browser(cluster_manager: ClusterDocumentManager):
     col1, col2 = st.columns(2)
     
     with col1:
-        clusters = list(set(p.cluster_name for p in all_projects))
+        clusters = list(cluster_manager.cluster_names)
         selected_clusters = st.multiselect(
             "Filter by Cluster",
             clusters,
@@ -173,19 +219,14 @@ def display_cluster_browser(cluster_manager: ClusterDocumentManager):
             ["Code", "Title", "Cluster"]
         )
     
-    # Filter and sort
+    # Filter and sort (cached per selection)
     filtered_projects = [
-        p for p in all_projects 
-        if p.cluster_name in selected_clusters
+        all_projects[position]
+        for position in _cached_browse(
+            cluster_manager.fingerprint, tuple(selected_clusters), sort_by, cluster_manager
+        )
     ]
     
-    if sort_by == "Code":
-        filtered_projects.sort(key=lambda x: x.code)
-    elif sort_by == "Title":
-        filtered_projects.sort(key=lambda x: x.title)
-    else:
-        filtered_projects.sort(key=lambda x: x.cluster_name)
-    
     st.write(f"**Showing {len(filtered_projects)} projects**")
     
     # Display projects
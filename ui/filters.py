@@ -1,12 +1,20 @@
 """Filter components"""
 
+import numpy as np
+import pandas as pd
 import streamlit as st
 from typing import List, Tuple
 from core.models import ProjectMatch
 
+# Prefix of the one-hot technology columns in the match frame
+TECH_COLUMN_PREFIX = 'tech:'
 
-def display_filters(matches: List[ProjectMatch]) -> Tuple[List[str], List[str], List[str]]:
-    """Display filter controls and return selected filters"""
+
+def display_filters(match_frame: pd.DataFrame) -> Tuple[List[str], List[str], List[str]]:
+    """Display filter controls and return selected filters
+    
+    Options come from the match frame (see build_match_frame), not from a scan of every match.
+    """
     col1, col2, col3 = st.columns(3)
     
     with col1:
@@ -17,11 +25,11 @@ def display_filters(matches: List[ProjectMatch]) -> Tuple[List[str], List[str],
         )
     
     with col2:
-        tech_options = list(set(
-            tech 
-            for match in matches 
-            for tech in match.technologies
-        ))
+        tech_options = [
+            column[len(TECH_COLUMN_PREFIX):]
+            for column in match_frame.columns
+            if column.startswith(TECH_COLUMN_PREFIX)
+        ]
         tech_filter = st.multiselect(
             "Filter by Technology",
             tech_options,
@@ -29,7 +37,7 @@ def display_filters(matches: List[ProjectMatch]) -> Tuple[List[str], List[str],
         )
     
     with col3:
-        sheet_options = list(set(match.sheet_name for match in matches))
+        sheet_options = sorted(match_frame['sheet_name'].unique())
         sheet_filter = st.multiselect(
             "Filter by Sheet",
             sheet_options,
@@ -39,15 +47,43 @@ def display_filters(matches: List[ProjectMatch]) -> Tuple[List[str], List[str],
     return priority_filter, tech_filter, sheet_filter
 
 
-def apply_filters(matches: List[ProjectMatch], 
+def build_match_frame(matches: List[ProjectMatch]) -> pd.DataFrame:
+    """Table of the filterable fields of every match, one row per match in list order
+    
+    Technologies are one-hot encoded, so filters become column masks.
+    """
+    columns = {
+        'priority': [m.priority_level for m in matches],
+        'sheet_name': [m.sheet_name for m in matches]
+    }
+    
+    technologies = sorted(set(tech for m in matches for tech in m.technologies))
+    for tech in technologies:
+        columns[TECH_COLUMN_PREFIX + tech] = np.zeros(len(matches), dtype=bool)
+    for position, m in enumerate(matches):
+        for tech in m.technologies:
+            columns[TECH_COLUMN_PREFIX + tech][position] = True
+    
+    # All columns in one constructor call instead of one insert per technology
+    return pd.DataFrame(columns, copy=False)
+
+
+def apply_filters(match_frame: pd.DataFrame,
                  priority_filter: List[str],
                  tech_filter: List[str],
-                 sheet_filter: List[str]) -> List[ProjectMatch]:
-    """Apply filters to matches"""
-    filtered = [
-        m for m in matches
-        if m.priority_level in priority_filter
-        and any(tech in tech_filter for tech in m.technologies)
-        and m.sheet_name in sheet_filter
+                 sheet_filter: List[str]) -> np.ndarray:
+    """Apply filters to matches
+    
+    Returns the positions of the matching rows, in match order.
+    """
+    tech_columns = [
+        TECH_COLUMN_PREFIX + tech for tech in tech_filter
+        if TECH_COLUMN_PREFIX + tech in match_frame.columns
     ]
-    return filtered
\ No newline at end of file
+    
+    mask = (
+        match_frame['priority'].isin(priority_filter).to_numpy()
+        & match_frame[tech_columns].to_numpy().any(axis=1)
+        & match_frame['sheet_name'].isin(sheet_filter).to_numpy()
+    )
+    return np.flatnonzero(mask)
@@ -2,7 +2,7 @@
 
 import streamlit as st
 import math
-from typing import List, Tuple
+from typing import Sequence, Tuple
 
 
 def display_pagination(total_items: int, items_per_page: int) -> int:
@@ -40,8 +40,8 @@ def display_pagination(total_items: int, items_per_page: int) -> int:
     return st.session_state.current_page
 
 
-def get_paginated_items(items: List, page: int, items_per_page: int) -> Tuple[List, int]:
-    """Get items for current page"""
+def get_paginated_items(items: Sequence, page: int, items_per_page: int) -> Tuple[Sequence, int]:
+    """Get items for current page (a list or an array of positions)"""
     start_idx = (page - 1) * items_per_page
     end_idx = start_idx + items_per_page
     return items[start_idx:end_idx], start_idx
\ No newline at end of file
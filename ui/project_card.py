@@ -4,17 +4,42 @@ import streamlit as st
 from core.models import ProjectMatch
 from utils.project_info import extract_project_info
 
+# Fragments (Streamlit >= 1.37, experimental since 1.33) rerun only the card whose
+# widget changed; older releases render the card as part of the full script run
+_fragment = (
+    getattr(st, 'fragment', None)
+    or getattr(st, 'experimental_fragment', None)
+    or (lambda func: func)
+)
+
+
+PRIORITY_COLORS = {
+    "HIGH": "#90EE90",
+    "MEDIUM": "#FFD700",
+    "LOW": "#87CEEB"
+}
+DEFAULT_PRIORITY_COLOR = "#FFFFFF"
+
+_HEADER_TEMPLATE = """
+        <div style="background-color: {color}; padding: 10px; border-radius: 5px; margin-bottom: 15px;">
+            <h4 style="margin: 0;">{title}</h4>
+        </div>
+        """
+
+# Card header HTML per priority, with only the title left to fill in
+_PRIORITY_HEADERS = {
+    priority: _HEADER_TEMPLATE.format(color=color, title='{title}')
+    for priority, color in PRIORITY_COLORS.items()
+}
+_DEFAULT_HEADER = _HEADER_TEMPLATE.format(color=DEFAULT_PRIORITY_COLOR, title='{title}')
+
 
 def get_priority_color(priority: str) -> str:
     """Get color for priority level"""
-    colors = {
-        "HIGH": "#90EE90",
-        "MEDIUM": "#FFD700",
-        "LOW": "#87CEEB"
-    }
-    return colors.get(priority, "#FFFFFF")
+    return PRIORITY_COLORS.get(priority, DEFAULT_PRIORITY_COLOR)
 
 
+@_fragment
 def display_match_card(match: ProjectMatch, index: int, show_cluster_matches: bool = False):
     """Display a match as a card with detailed information
     
@@ -23,20 +48,20 @@ def display_match_card(match: ProjectMatch, index: int, show_cluster_matches: bo
         index: Display index
         show_cluster_matches: Whether to show cluster match section
     """
-    priority_color = get_priority_color(match.priority_level)
+    priority = match.priority_level
     info = extract_project_info(match)
+    title = info['title'] or match.get_project_title()
     
     with st.expander(
-        f"#{index} - {info['title'] or match.get_project_title()} - "
-        f"Score: {match.score} ({match.priority_level})",
+        f"#{index} - {title} - "
+        f"Score: {match.score} ({priority})",
         expanded=False
     ):
         # Header with colored background
-        st.markdown(f"""
-        <div style="background-color: {priority_color}; padding: 10px; border-radius: 5px; margin-bottom: 15px;">
-            <h4 style="margin: 0;">{info['title'] or match.get_project_title()}</h4>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(
+            _PRIORITY_HEADERS.get(priority, _DEFAULT_HEADER).format(title=title),
+            unsafe_allow_html=True
+        )
         
         # Project metadata
         _display_project_metadata(match, info)
@@ -55,8 +80,9 @@ def display_match_card(match: ProjectMatch, index: int, show_cluster_matches: bo
             # Placeholder for cluster matches - will be filled by app.py
             st.session_state[f'cluster_match_placeholder_{index}'] = True
         
-        # Raw data viewer
-        with st.expander("🔧 View Raw Data"):
+        # Raw data viewer, only sent to the frontend on request (expander contents
+        # are rendered even while collapsed)
+        if st.checkbox("🔧 View Raw Data", key=f"raw_data_{match.sheet_name}_{match.row_index}"):
             st.json(match.project_data)
 
 
@@ -66,31 +92,30 @@ def _display_project_metadata(match: ProjectMatch, info: dict):
     
     meta_col1, meta_col2, meta_col3 = st.columns(3)
     
+    # One markdown element per column instead of one per line
     with meta_col1:
-        st.write(f"**Sheet:** {match.sheet_name}")
-        st.write(f"**Excel Row:** {match.row_index}")
-        st.write(f"**Score:** {match.score}")
-        st.write(f"**Priority:** {match.priority_level}")
+        _write_lines([
+            f"**Sheet:** {match.sheet_name}",
+            f"**Excel Row:** {match.row_index}",
+            f"**Score:** {match.score}",
+            f"**Priority:** {match.priority_level}"
+        ])
     
     with meta_col2:
-        if info['call_id']:
-            st.write(f"**Call ID:** {info['call_id']}")
-        if info['opening_date']:
-            st.write(f"**Opening:** {info['opening_date']}")
-        if info['deadline']:
-            st.write(f"**Deadline:** {info['deadline']}")
-        if info['type_of_action']:
-            st.write(f"**Action Type:** {info['type_of_action']}")
+        _write_lines([
+            info['call_id'] and f"**Call ID:** {info['call_id']}",
+            info['opening_date'] and f"**Opening:** {info['opening_date']}",
+            info['deadline'] and f"**Deadline:** {info['deadline']}",
+            info['type_of_action'] and f"**Action Type:** {info['type_of_action']}"
+        ])
     
     with meta_col3:
-        if info['budget']:
-            st.write(f"**Budget:** {info['budget']}")
-        if info['partners']:
-            st.write(f"**Partners:** {info['partners']}")
-        if info['coordinator']:
-            st.write(f"**Coordinator:** {info['coordinator']}")
-        if info['url']:
-            st.markdown(f"**[📎 Call Link]({info['url']})**")
+        _write_lines([
+            info['budget'] and f"**Budget:** {info['budget']}",
+            info['partners'] and f"**Partners:** {info['partners']}",
+            info['coordinator'] and f"**Coordinator:** {info['coordinator']}",
+            info['url'] and f"**[📎 Call Link]({info['url']})**"
+        ])
 
 
 def _display_technology_matching(match: ProjectMatch):
@@ -100,52 +125,57 @@ def _display_technology_matching(match: ProjectMatch):
     col1, col2 = st.columns(2)
     
     with col1:
-        st.write("**Technologies:**")
-        for tech in match.technologies:
-            st.write(f"- {tech}")
-        
-        st.write("")
-        st.write("**Matched Keywords:**")
+        lines = ["**Technologies:**", _bullets(match.technologies), "**Matched Keywords:**"]
         for category, keywords in match.matched_keywords.items():
-            st.write(f"*{category.replace('_', ' ').title()}:*")
-            st.write(f"{', '.join(keywords)}")
+            lines.append(f"*{category.replace('_', ' ').title()}:*")
+            lines.append(f"{', '.join(keywords)}")
+        _write_lines(lines)
     
     with col2:
-        st.write("**Potential Roles:**")
-        for role in match.potential_roles:
-            st.write(f"- {role}")
-        
-        st.write("")
-        st.write("**Suggested Contributions:**")
-        for contrib in match.contributions:
-            st.write(f"- {contrib}")
+        _write_lines([
+            "**Potential Roles:**",
+            _bullets(match.potential_roles),
+            "**Suggested Contributions:**",
+            _bullets(match.contributions)
+        ])
+
+
+def _bullets(items) -> str:
+    """Markdown bullet list, one item per line"""
+    return "\n".join(f"- {item}" for item in items)
+
+
+def _write_lines(lines):
+    """Write the non-empty lines as separate paragraphs of a single markdown element"""
+    text = "\n\n".join(line for line in lines if line)
+    if text:
+        st.markdown(text)
 
 
 def _display_additional_details(info: dict):
     """Display additional project details"""
-    if any([info['description'], info['scope'], info['expected_outcomes'], info['topics']]):
-        st.divider()
-        st.subheader("📝 Additional Details")
-        
-        if info['topics']:
-            with st.container():
-                st.write("**Topics/Destination:**")
-                st.info(info['topics'])
-        
-        if info['description']:
-            with st.container():
-                st.write("**Description:**")
-                st.info(info['description'][:1000] + "..." 
-                       if len(info['description']) > 1000 else info['description'])
-        
-        if info['scope']:
-            with st.container():
-                st.write("**Scope:**")
-                st.info(info['scope'][:1000] + "..." 
-                       if len(info['scope']) > 1000 else info['scope'])
-        
-        if info['expected_outcomes']:
-            with st.container():
-                st.write("**Expected Outcomes:**")
-                st.info(info['expected_outcomes'][:1000] + "..." 
-                       if len(info['expected_outcomes']) > 1000 else info['expected_outcomes'])
\ No newline at end of file
+    if not info['has_details']:
+        return
+    
+    st.divider()
+    st.subheader("📝 Additional Details")
+    
+    if info['topics']:
+        with st.container():
+            st.write("**Topics/Destination:**")
+            st.info(info['topics'])
+    
+    if info['description']:
+        with st.container():
+            st.write("**Description:**")
+            st.info(info['description_display'])
+    
+    if info['scope']:
+        with st.container():
+            st.write("**Scope:**")
+            st.info(info['scope_display'])
+    
+    if info['expected_outcomes']:
+        with st.container():
+            st.write("**Expected Outcomes:**")
+            st.info(info['expected_outcomes_display'])
\ No newline at end of file
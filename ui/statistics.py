@@ -2,35 +2,39 @@
 
 import streamlit as st
 import re
+from collections import Counter
 from typing import List
 from core.models import ProjectMatch
 from utils.project_info import extract_project_info
 
+# First number in a partners field ("3-5 partners" -> 3)
+_PARTNERS_DIGITS = re.compile(r'\d+')
+
 
 def display_statistics(matches: List[ProjectMatch]):
     """Display analysis statistics"""
-    high_priority = sum(1 for m in matches if m.priority_level == "HIGH")
-    medium_priority = sum(1 for m in matches if m.priority_level == "MEDIUM")
-    low_priority = sum(1 for m in matches if m.priority_level == "LOW")
+    # Count by priority and by sheet in the same pass
+    priority_counts = Counter()
+    sheet_counts = Counter()
     
     # Calculate total partners if available
     total_partners = 0
     partners_found = 0
     
-    # Count by sheet
-    sheet_counts = {}
     for match in matches:
-        sheet_counts[match.sheet_name] = sheet_counts.get(match.sheet_name, 0) + 1
+        priority_counts[match.priority_level] += 1
+        sheet_counts[match.sheet_name] += 1
         
         info = extract_project_info(match)
         if info['partners']:
-            try:
-                numbers = re.findall(r'\d+', info['partners'])
-                if numbers:
-                    total_partners += int(numbers[0])
-                    partners_found += 1
-            except:
-                pass
+            number = _PARTNERS_DIGITS.search(info['partners'])
+            if number:
+                total_partners += int(number.group())
+                partners_found += 1
+    
+    high_priority = priority_counts["HIGH"]
+    medium_priority = priority_counts["MEDIUM"]
+    low_priority = priority_counts["LOW"]
     
     # Main metrics
     col1, col2, col3, col4, col5 = st.columns(5)
@@ -1,6 +1,7 @@
 """Utilities package"""
 
 from .project_info import extract_project_info
-from .export import export_to_csv, export_to_json
+from .export import export_to_csv, export_to_json, cached_export_to_csv, cached_export_to_json
 
-__all__ = ['extract_project_info', 'export_to_csv', 'export_to_json']
\ No newline at end of file
+__all__ = ['extract_project_info', 'export_to_csv', 'export_to_json',
+           'cached_export_to_csv', 'cached_export_to_json']
\ No newline at end of file
@@ -1,19 +1,38 @@
-"""Export utilities"""
+"""Export utilities
 
-import pandas as pd
+The cached_* variants memoize the serialized export with st.cache_data. They are keyed
+only on the caller's signature (the matches themselves are not hashed), so the signature
+must change whenever the analyzed file or the selection of matches changes.
+"""
+
+import csv
+import io
 import json
-from typing import List
+import streamlit as st
+from typing import List, Tuple
 from core.models import ProjectMatch
-from .project_info import extract_project_info
+from .project_info import PROJECT_FIELDS, extract_project_info
+
+
+# Column order of the CSV export
+CSV_FIELDS = [
+    'excel_row', 'sheet_name', 'score', 'priority', 'title', 'call_id', 'opening_date',
+    'deadline', 'budget', 'partners', 'coordinator', 'type_of_action', 'technologies',
+    'potential_roles', 'matched_keywords', 'contributions', 'url'
+]
 
 
 def export_to_csv(matches: List[ProjectMatch]) -> bytes:
     """Export matches to CSV with detailed information"""
-    export_data = []
+    # Encoded to UTF-8 as rows are written, instead of encoding one large string at the end
+    buffer = io.BytesIO()
+    text_buffer = io.TextIOWrapper(buffer, encoding='utf-8', newline='')
+    writer = csv.DictWriter(text_buffer, fieldnames=CSV_FIELDS, lineterminator='\n')
+    writer.writeheader()
     
     for match in matches:
         info = extract_project_info(match)
-        row = {
+        writer.writerow({
             'excel_row': match.row_index,
             'sheet_name': match.sheet_name,
             'score': match.score,
@@ -28,25 +47,48 @@ def export_to_csv(matches: List[ProjectMatch]) -> bytes:
             'type_of_action': info['type_of_action'],
             'technologies': ', '.join(match.technologies),
             'potential_roles': ', '.join(match.potential_roles),
-            'matched_keywords': str(match.matched_keywords),
+            'matched_keywords': json.dumps(match.matched_keywords, separators=(',', ':'), ensure_ascii=False),
             'contributions': ', '.join(match.contributions),
             'url': info['url']
-        }
-        export_data.append(row)
+        })
     
-    df = pd.DataFrame(export_data)
-    return df.to_csv(index=False).encode('utf-8')
+    text_buffer.detach()  # flushes, and leaves the BytesIO open
+    return buffer.getvalue()
 
 
 def export_to_json(matches: List[ProjectMatch]) -> str:
-    """Export matches to JSON with detailed information"""
-    export_data = []
+    """Export matches to JSON with detailed information
+    
+    Serialized one match at a time, with the same layout as json.dumps(list, indent=2).
+    """
+    if not matches:
+        return '[]'
+    
+    buffer = io.StringIO()
+    separator = '[\n  '
     
     for match in matches:
         info = extract_project_info(match)
         data = match.to_dict()
         data['excel_row'] = match.row_index
-        data['detailed_info'] = info
-        export_data.append(data)
+        data['detailed_info'] = {field: info[field] for field in PROJECT_FIELDS}
+        
+        buffer.write(separator)
+        # Nest one level inside the list; strings escape their own newlines
+        buffer.write(json.dumps(data, indent=2).replace('\n', '\n  '))
+        separator = ',\n  '
     
-    return json.dumps(export_data, indent=2)
\ No newline at end of file
+    buffer.write('\n]')
+    return buffer.getvalue()
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def cached_export_to_csv(signature: Tuple, _matches: List[ProjectMatch]) -> bytes:
+    """export_to_csv, serialized once per signature"""
+    return export_to_csv(_matches)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def cached_export_to_json(signature: Tuple, _matches: List[ProjectMatch]) -> str:
+    """export_to_json, serialized once per signature"""
+    return export_to_json(_matches)
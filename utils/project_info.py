@@ -5,85 +5,100 @@ from typing import Dict, Any
 from core.models import ProjectMatch
 
 
-def extract_project_info(match: ProjectMatch) -> Dict[str, Any]:
-    """Extract detailed project information from match data"""
-    data = match.project_data
-    
-    info = {
-        'title': None,
-        'call_id': None,
-        'deadline': None,
-        'budget': None,
-        'partners': None,
-        'coordinator': None,
-        'type_of_action': None,
-        'topics': None,
-        'description': None,
-        'expected_outcomes': None,
-        'scope': None,
-        'opening_date': None,
-        'url': None
-    }
-    
+# Candidate columns for each project field, most preferred first
+_FIELD_KEYS = {
     # Title variations
-    title_keys = ['Title', 'title', 'Project Title', 'PROJECT_TITLE', 'Call title', 'Topic title', 'Topic']
-    info['title'] = _extract_first_valid(data, title_keys)
-    
+    'title': ['Title', 'title', 'Project Title', 'PROJECT_TITLE', 'Call title', 'Topic title', 'Topic'],
     # Call ID variations
-    call_id_keys = ['Call ID', 'Call identifier', 'Topic ID', 'Identifier', 'ID', 'Topic identifier']
-    info['call_id'] = _extract_first_valid(data, call_id_keys)
-    
+    'call_id': ['Call ID', 'Call identifier', 'Topic ID', 'Identifier', 'ID', 'Topic identifier'],
     # Deadline variations
-    deadline_keys = ['Deadline', 'Submission deadline', 'Closing date', 'Deadline date', 'Deadline model']
-    info['deadline'] = _extract_first_valid(data, deadline_keys)
-    
-    # Opening date
-    opening_keys = ['Opening date', 'Opening', 'Start date']
-    info['opening_date'] = _extract_first_valid(data, opening_keys)
-    
+    'deadline': ['Deadline', 'Submission deadline', 'Closing date', 'Deadline date', 'Deadline model'],
     # Budget variations
-    budget_keys = ['Budget', 'Total budget', 'Funding', 'Budget (EUR)', 'EU contribution', 'Indicative budget']
-    info['budget'] = _extract_first_valid(data, budget_keys)
-    
+    'budget': ['Budget', 'Total budget', 'Funding', 'Budget (EUR)', 'EU contribution', 'Indicative budget'],
     # Partners variations
-    partner_keys = ['Partners', 'Number of partners', 'Expected partners', 'Consortium size', 
-                    'Min partners', 'Max partners', 'Planned number of grants']
-    info['partners'] = _extract_first_valid(data, partner_keys)
-    
+    'partners': ['Partners', 'Number of partners', 'Expected partners', 'Consortium size',
+                 'Min partners', 'Max partners', 'Planned number of grants'],
     # Coordinator variations
-    coordinator_keys = ['Coordinator', 'Coordinating entity', 'Lead partner']
-    info['coordinator'] = _extract_first_valid(data, coordinator_keys)
-    
+    'coordinator': ['Coordinator', 'Coordinating entity', 'Lead partner'],
     # Type of action variations
-    action_keys = ['Type of Action', 'Action type', 'Type', 'Action', 'Type of action']
-    info['type_of_action'] = _extract_first_valid(data, action_keys)
-    
+    'type_of_action': ['Type of Action', 'Action type', 'Type', 'Action', 'Type of action'],
     # Topics variations (excluding 'Topic' to avoid duplicate with title)
-    topic_keys = ['Topics', 'Research topics', 'Themes', 'Call', 'Destination']
-    info['topics'] = _extract_first_valid(data, topic_keys)
-    
+    'topics': ['Topics', 'Research topics', 'Themes', 'Call', 'Destination'],
     # Description variations
-    desc_keys = ['Description', 'Call description', 'Topic description', 'Summary', 'Expected Outcome']
-    info['description'] = _extract_first_valid(data, desc_keys)
-    
+    'description': ['Description', 'Call description', 'Topic description', 'Summary', 'Expected Outcome'],
     # Expected outcomes variations
-    outcome_keys = ['Expected outcomes', 'Outcomes', 'Expected impacts', 'Specific challenge']
-    info['expected_outcomes'] = _extract_first_valid(data, outcome_keys)
-    
+    'expected_outcomes': ['Expected outcomes', 'Outcomes', 'Expected impacts', 'Specific challenge'],
     # Scope variations
-    scope_keys = ['Scope', 'Call scope', 'Topic scope']
-    info['scope'] = _extract_first_valid(data, scope_keys)
-    
+    'scope': ['Scope', 'Call scope', 'Topic scope'],
+    # Opening date
+    'opening_date': ['Opening date', 'Opening', 'Start date'],
     # URL variations
-    url_keys = ['URL', 'Link', 'Web link', 'Call URL']
-    info['url'] = _extract_first_valid(data, url_keys)
+    'url': ['URL', 'Link', 'Web link', 'Call URL']
+}
+
+# Extracted fields, in info dict order (the *_display variants and has_details are derived)
+PROJECT_FIELDS = tuple(_FIELD_KEYS)
+
+# Long text fields, shortened once for display in the project cards
+DISPLAY_MAX_CHARS = 1000
+_DISPLAY_FIELDS = ('description', 'scope', 'expected_outcomes')
+
+# Column name -> (field, preference), so a row is scanned once instead of once per field
+_KEY_TABLE = {
+    key: (field, priority)
+    for field, keys in _FIELD_KEYS.items()
+    for priority, key in enumerate(keys)
+}
+
+
+def _isna(value: Any) -> bool:
+    """Scalar null check; plain strings and numbers skip the pandas dispatch"""
+    if value is None:
+        return True
+    if isinstance(value, float):
+        return value != value
+    if isinstance(value, (str, int)):
+        return False
+    # NaT, pd.NA and other less common types
+    return bool(pd.isna(value))
+
+
+def extract_project_info(match: ProjectMatch) -> Dict[str, Any]:
+    """Extract detailed project information from match data
     
+    Computed once per match and kept on it; callers share the dict and must not modify it.
+    Matches live in session state, so this already covers reruns. Extraction is cheaper
+    than hashing the row for a cross-session cache.
+    """
+    info = getattr(match, '_info', None)
+    if info is None:
+        info = _build_project_info(match.project_data)
+        match._info = info
     return info
 
 
-def _extract_first_valid(data: Dict, keys: list) -> str:
-    """Extract first valid value from data using list of possible keys"""
-    for key in keys:
-        if key in data and pd.notna(data[key]):
-            return str(data[key])
-    return None
\ No newline at end of file
+def _build_project_info(data: Dict) -> Dict[str, Any]:
+    """Pick each project field from the most preferred column holding a value"""
+    info = dict.fromkeys(PROJECT_FIELDS)
+    best_priority = {}
+    
+    for key, value in data.items():
+        slot = _KEY_TABLE.get(key)
+        if slot is None or _isna(value):
+            continue
+        field, priority = slot
+        if priority < best_priority.get(field, len(_FIELD_KEYS[field])):
+            info[field] = str(value)
+            best_priority[field] = priority
+    
+    for field in _DISPLAY_FIELDS:
+        text = info[field]
+        if text and len(text) > DISPLAY_MAX_CHARS:
+            text = text[:DISPLAY_MAX_CHARS] + "..."
+        info[field + '_display'] = text
+    
+    info['has_details'] = bool(
+        info['description'] or info['scope'] or info['expected_outcomes'] or info['topics']
+    )
+    
+    return info